@@ -4,6 +4,7 @@ A comprehensive Python SDK for go-objstore with support for REST, gRPC, QUIC/HTT
 MCP (Model Context Protocol HTTP), and Unix domain socket protocols.
 """
 
+from objstore.async_rest_client import AsyncRestClient
 from objstore.client import ObjectStoreClient, Protocol
 from objstore.mcp_client import McpClient
 from objstore.unix_client import UnixClient
@@ -47,6 +48,7 @@ __version__ = "0.2.0"
 __all__ = [
     "ObjectStoreClient",
     "Protocol",
+    "AsyncRestClient",
     "McpClient",
     "UnixClient",
     "AlreadyExistsError",
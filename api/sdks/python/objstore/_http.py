@@ -1,10 +1,26 @@
 """Shared HTTP helpers for the REST, QUIC, and MCP clients.
 
 Centralizes Bearer/X-Tenant-ID header assembly and HTTP status-code to
-exception mapping so the HTTP-based transports stay in sync.
+exception mapping so the HTTP-based transports stay in sync. The ``parse_*``
+functions turn REST API responses into models for both the blocking and the
+asyncio REST clients, which only differ in how they send requests.
 """
 
-from typing import Any, Dict, Optional, Protocol
+import json
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Collection,
+    Dict,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from objstore.exceptions import (
     AlreadyExistsError,
@@ -16,13 +32,96 @@ from objstore.exceptions import (
     ServerError,
     ValidationError,
 )
+from objstore.models import (
+    LP_LIST_ADAPTER,
+    RP_LIST_ADAPTER,
+    ApplyPoliciesResponse,
+    ArchiveResponse,
+    DeleteResponse,
+    ExistsResponse,
+    GetPoliciesResponse,
+    GetReplicationPoliciesResponse,
+    GetReplicationStatusResponse,
+    HealthResponse,
+    HealthStatus,
+    ListResponse,
+    Metadata,
+    ObjectInfo,
+    PolicyResponse,
+    PutResponse,
+    ReplicationPolicy,
+    ReplicationStatus,
+    SyncResult,
+    TriggerReplicationResponse,
+)
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON, as ``requests``' ``json=`` does."""
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+# orjson encodes and decodes JSON bodies several times faster; it is optional.
+# Payloads are dumped with ``model_dump(mode="json")`` so both paths only ever
+# see plain JSON types and produce the same document.
+json_dumps: Callable[[Any], bytes]
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = _stdlib_json_dumps
+    json_loads = json.loads
+
+# Error statuses whose exception carries a fixed message.
+_STATUS_ERRORS: Dict[int, Tuple[Type[ObjectStoreError], str]] = {
+    401: (AuthenticationError, "Authentication failed"),
+    403: (AuthorizationError, "Access denied"),
+    404: (ObjectNotFoundError, "Object not found"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
+
+# Error statuses whose exception carries the server's message, with a fallback.
+_STATUS_MESSAGE_ERRORS: Dict[int, Tuple[Type[ObjectStoreError], str]] = {
+    400: (ValidationError, "Validation error"),
+    409: (AlreadyExistsError, "Already exists"),
+}
+
+# Metadata fields sent as plain upload headers, as (attribute, header) pairs.
+_METADATA_HEADER_FIELDS = (
+    ("content_type", "Content-Type"),
+    ("content_encoding", "Content-Encoding"),
+)
+
+
+# Response models that only carry a success flag and a message.
+_MessageResponse = TypeVar("_MessageResponse", ArchiveResponse, PolicyResponse)
 
 
 class HttpResponse(Protocol):
     """Minimal response surface shared by requests and httpx responses."""
 
-    status_code: int
-    text: str
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Case-insensitive response headers."""
+        ...
+
+    @property
+    def content(self) -> bytes:
+        """Raw response body."""
+        ...
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code of the response."""
+        ...
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        ...
 
     def json(self) -> Any:
         """Return the response body parsed as JSON."""
@@ -55,6 +154,63 @@ def build_auth_headers(
     return headers
 
 
+def build_metadata_headers(metadata: Optional[Metadata]) -> Dict[str, str]:
+    """Build the REST upload headers that carry object metadata.
+
+    Args:
+        metadata: Optional metadata
+
+    Returns:
+        Headers dict; custom metadata is JSON-encoded in X-Object-Metadata
+    """
+    if not metadata:
+        return {}
+    headers = {
+        header: value
+        for attr, header in _METADATA_HEADER_FIELDS
+        if (value := getattr(metadata, attr))
+    }
+    if metadata.custom:
+        headers["X-Object-Metadata"] = json.dumps(metadata.custom)
+    return headers
+
+
+def parse_metadata_header(header: Optional[str]) -> Dict[str, str]:
+    """Parse the custom metadata map carried in an X-Object-Metadata header.
+
+    The REST server returns custom metadata as a JSON string->string object.
+    A missing or malformed header yields an empty map.
+
+    Args:
+        header: Raw X-Object-Metadata header value, if present
+
+    Returns:
+        Custom metadata map
+    """
+    if not header:
+        return {}
+    try:
+        parsed = json.loads(header)
+    except (ValueError, TypeError):
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {str(k): str(v) for k, v in parsed.items()}
+
+
+def is_seekable(data: BinaryIO) -> bool:
+    """Return True if a file-like upload source can be rewound and resent.
+
+    Args:
+        data: File-like object
+
+    Returns:
+        True when ``data.seekable()`` exists and reports True
+    """
+    seekable = getattr(data, "seekable", None)
+    return bool(seekable and seekable())
+
+
 def handle_http_error(response: HttpResponse) -> None:
     """Translate an HTTP error response into an SDK exception.
 
@@ -64,33 +220,459 @@ def handle_http_error(response: HttpResponse) -> None:
     Raises:
         ObjectStoreError: For various error conditions
     """
-    if response.status_code == 404:
-        raise ObjectNotFoundError("Object not found")
-    if response.status_code == 401:
-        raise AuthenticationError("Authentication failed")
-    if response.status_code == 403:
-        raise AuthorizationError("Access denied")
-    if response.status_code == 409:
-        try:
-            message = response.json().get("message", "Already exists")
-        except Exception:
-            message = response.text or "Already exists"
-        raise AlreadyExistsError(message)
-    if response.status_code == 429:
-        raise RateLimitError("Rate limit exceeded")
-    if response.status_code == 400:
+    status = response.status_code
+    fixed = _STATUS_ERRORS.get(status)
+    if fixed is not None:
+        exc_type, message = fixed
+        raise exc_type(message)
+    from_body = _STATUS_MESSAGE_ERRORS.get(status)
+    if from_body is not None:
+        exc_type, default = from_body
+        raise exc_type(_error_message(response, default))
+    if status >= 500:
+        raise ServerError(_error_message(response, "Server error"), status_code=status)
+    raise ObjectStoreError(f"HTTP {status}: {response.text}", status_code=status)
+
+
+def _error_message(response: HttpResponse, default: str) -> str:
+    """Return the ``message`` field of a JSON error body, else the raw body."""
+    try:
+        return str(response.json().get("message", default))
+    except Exception:
+        return response.text or default
+
+
+def json_body(payload: Any) -> bytes:
+    """Serialize a model (unset fields dropped) or plain value as a JSON body.
+
+    Args:
+        payload: Pydantic model or JSON-compatible value
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    if hasattr(payload, "model_dump"):
+        payload = payload.model_dump(mode="json", exclude_none=True)
+    return json_dumps(payload)
+
+
+def list_params(
+    prefix: str, delimiter: str, max_results: int, continue_from: Optional[str]
+) -> Dict[str, Union[str, int]]:
+    """Build the query parameters for listing objects.
+
+    Args:
+        prefix: Filter objects by prefix
+        delimiter: Delimiter for hierarchical listing
+        max_results: Maximum number of results
+        continue_from: Pagination token
+
+    Returns:
+        Query parameters, omitting empty filters
+    """
+    params: Dict[str, Union[str, int]] = {"limit": max_results}
+    if prefix:
+        params["prefix"] = prefix
+    if delimiter:
+        params["delimiter"] = delimiter
+    if continue_from:
+        params["token"] = continue_from
+    return params
+
+
+def parse_put_response(response: HttpResponse) -> PutResponse:
+    """Parse an object upload response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        PutResponse with operation result
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 201:
+        result = json_loads(response.content)
+        return PutResponse(
+            success=True,
+            message=result.get("message", "Object uploaded successfully"),
+            etag=result.get("data", {}).get("etag"),
+        )
+
+    handle_http_error(response)
+    return PutResponse(success=False, message="Upload failed")
+
+
+def parse_object_metadata(response: HttpResponse) -> Metadata:
+    """Build an object's metadata from the headers of a download response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Object metadata
+    """
+    headers = response.headers
+    return Metadata(
+        content_type=headers.get("Content-Type"),
+        content_encoding=headers.get("Content-Encoding"),
+        size=int(headers.get("Content-Length", 0)),
+        etag=headers.get("ETag"),
+        custom=parse_metadata_header(headers.get("X-Object-Metadata")),
+    )
+
+
+def parse_get_response(response: HttpResponse) -> Tuple[bytes, Metadata]:
+    """Parse an object download response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Tuple of (data, metadata)
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        return response.content, parse_object_metadata(response)
+
+    handle_http_error(response)
+    return b"", Metadata()
+
+
+def parse_delete_response(response: HttpResponse) -> DeleteResponse:
+    """Parse an object delete response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        DeleteResponse with operation result
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    # The server returns 204 No Content (no body); tolerate 200 + JSON
+    # from older servers.
+    if response.status_code == 204:
+        return DeleteResponse(success=True, message="Object deleted successfully")
+
+    if response.status_code == 200:
+        result = json_loads(response.content)
+        return DeleteResponse(
+            success=True, message=result.get("message", "Object deleted successfully")
+        )
+
+    # Handle server returning 500 for non-existent objects (should be 404)
+    if response.status_code == 500:
         try:
-            message = response.json().get("message", "Validation error")
-        except Exception:
-            message = response.text or "Validation error"
-        raise ValidationError(message)
-    if response.status_code >= 500:
+            error_data = json_loads(response.content)
+            message = error_data.get("message", "").lower()
+            if "not found" in message or "does not exist" in message:
+                raise ObjectNotFoundError("Object not found")
+        except (ValueError, KeyError):
+            pass
+
+    handle_http_error(response)
+    return DeleteResponse(success=False, message="Delete failed")
+
+
+def parse_list_response(response: HttpResponse) -> ListResponse:
+    """Parse an object listing response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        ListResponse with matching objects
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        objects = [
+            ObjectInfo(
+                key=obj["key"],
+                metadata=Metadata(
+                    size=obj.get("size"),
+                    etag=obj.get("etag"),
+                    custom=obj.get("metadata", {}),
+                ),
+            )
+            for obj in data.get("objects", [])
+        ]
+        return ListResponse(
+            objects=objects,
+            common_prefixes=data.get("common_prefixes", []),
+            next_token=data.get("next_token"),
+            truncated=data.get("truncated", False),
+        )
+
+    handle_http_error(response)
+    return ListResponse()
+
+
+def parse_exists_response(response: HttpResponse) -> ExistsResponse:
+    """Parse an object HEAD response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        ExistsResponse indicating existence
+
+    Raises:
+        ObjectStoreError: On failure other than 404
+    """
+    if response.status_code == 200:
+        return ExistsResponse(exists=True)
+
+    if response.status_code == 404:
+        return ExistsResponse(exists=False)
+
+    handle_http_error(response)
+    return ExistsResponse(exists=False)
+
+
+def parse_metadata_response(response: HttpResponse) -> Metadata:
+    """Parse a metadata lookup response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Object metadata
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        # Custom metadata is carried in the X-Object-Metadata response
+        # header (JSON string->string map). The /metadata/{key} body
+        # also returns the custom map under the "metadata" key, so fall
+        # back to that when the header is absent.
+        custom = parse_metadata_header(response.headers.get("X-Object-Metadata"))
+        if not custom:
+            body_custom = data.get("metadata")
+            if isinstance(body_custom, dict):
+                custom = {str(k): str(v) for k, v in body_custom.items()}
+        return Metadata(
+            content_type=data.get("content_type") or response.headers.get("Content-Type"),
+            content_encoding=response.headers.get("Content-Encoding"),
+            size=data.get("size"),
+            etag=data.get("etag"),
+            custom=custom,
+        )
+
+    handle_http_error(response)
+    return Metadata()
+
+
+def parse_health_response(response: HttpResponse) -> HealthResponse:
+    """Parse a health check response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        HealthResponse with server status
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        status_str = data.get("status", "UNKNOWN").upper()
         try:
-            message = response.json().get("message", "Server error")
-        except Exception:
-            message = response.text or "Server error"
-        raise ServerError(message, status_code=response.status_code)
-    raise ObjectStoreError(
-        f"HTTP {response.status_code}: {response.text}",
-        status_code=response.status_code,
+            status = HealthStatus(status_str)
+        except ValueError:
+            status = HealthStatus.UNKNOWN
+
+        return HealthResponse(status=status, message=data.get("message"))
+
+    handle_http_error(response)
+    return HealthResponse(status=HealthStatus.UNKNOWN)
+
+
+def parse_message_response(
+    response: HttpResponse,
+    model: Type[_MessageResponse],
+    ok_statuses: Collection[int],
+    success_message: str,
+    failure_message: str,
+) -> _MessageResponse:
+    """Parse a response that only reports success and a message.
+
+    Args:
+        response: HTTP response
+        model: Response model to build
+        ok_statuses: Status codes that mean success
+        success_message: Message used when the body carries none
+        failure_message: Message of the failed result
+
+    Returns:
+        ``model`` instance with operation result
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code in ok_statuses:
+        result = json_loads(response.content)
+        return model(success=True, message=result.get("message", success_message))
+
+    handle_http_error(response)
+    return model(success=False, message=failure_message)
+
+
+def parse_policies_response(response: HttpResponse) -> GetPoliciesResponse:
+    """Parse a lifecycle policy listing response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        GetPoliciesResponse with list of policies
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        policies = LP_LIST_ADAPTER.validate_python(data.get("policies", []))
+        return GetPoliciesResponse(
+            policies=policies,
+            success=True,
+            message=data.get("message", "Policies retrieved successfully"),
+        )
+
+    handle_http_error(response)
+    return GetPoliciesResponse(policies=[], success=False, message="Get policies failed")
+
+
+def parse_apply_policies_response(response: HttpResponse) -> ApplyPoliciesResponse:
+    """Parse an apply lifecycle policies response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        ApplyPoliciesResponse with operation result
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        return ApplyPoliciesResponse(
+            success=True,
+            policies_count=data.get("policies_count", 0),
+            objects_processed=data.get("objects_processed", 0),
+            message=data.get("message", "Policies applied successfully"),
+        )
+
+    handle_http_error(response)
+    return ApplyPoliciesResponse(
+        success=False, policies_count=0, objects_processed=0, message="Apply policies failed"
+    )
+
+
+def parse_replication_policies_response(
+    response: HttpResponse,
+) -> GetReplicationPoliciesResponse:
+    """Parse a replication policy listing response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        GetReplicationPoliciesResponse with list of policies
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        policies = RP_LIST_ADAPTER.validate_python(data.get("policies", []))
+        return GetReplicationPoliciesResponse(policies=policies)
+
+    handle_http_error(response)
+    return GetReplicationPoliciesResponse(policies=[])
+
+
+def parse_replication_policy_response(response: HttpResponse) -> ReplicationPolicy:
+    """Parse a single replication policy response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        ReplicationPolicy
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        # The server responds with a bare ReplicationPolicyResponse
+        # object (no "policy" wrapper key).
+        return ReplicationPolicy(**json_loads(response.content))
+
+    handle_http_error(response)
+    return ReplicationPolicy(id="", source_backend="", destination_backend="")
+
+
+def parse_trigger_replication_response(response: HttpResponse) -> TriggerReplicationResponse:
+    """Parse a trigger replication response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        TriggerReplicationResponse with sync result
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        data = json_loads(response.content)
+        result_data = data.get("result")
+        sync_result = SyncResult(**result_data) if result_data else None
+        return TriggerReplicationResponse(
+            success=True,
+            result=sync_result,
+            message=data.get("message", "Replication triggered successfully"),
+        )
+
+    handle_http_error(response)
+    return TriggerReplicationResponse(
+        success=False, result=None, message="Trigger replication failed"
+    )
+
+
+def parse_replication_status_response(response: HttpResponse) -> GetReplicationStatusResponse:
+    """Parse a replication status response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        GetReplicationStatusResponse with status
+
+    Raises:
+        ObjectStoreError: On failure
+    """
+    if response.status_code == 200:
+        # The server responds with a bare ReplicationStatusResponse
+        # object (no "status" wrapper key).
+        status = ReplicationStatus(**json_loads(response.content))
+        return GetReplicationStatusResponse(
+            success=True, status=status, message="Status retrieved successfully"
+        )
+
+    handle_http_error(response)
+    return GetReplicationStatusResponse(
+        success=False, status=None, message="Get replication status failed"
     )
@@ -0,0 +1,759 @@
+"""Asynchronous REST client implementation for go-objstore."""
+
+from typing import AsyncIterator, BinaryIO, Dict, Optional, Union
+
+import httpx
+
+from objstore._http import (
+    build_auth_headers,
+    build_metadata_headers,
+    handle_http_error,
+    is_seekable,
+    json_body,
+    list_params,
+    parse_apply_policies_response,
+    parse_delete_response,
+    parse_exists_response,
+    parse_get_response,
+    parse_health_response,
+    parse_list_response,
+    parse_message_response,
+    parse_metadata_response,
+    parse_policies_response,
+    parse_put_response,
+    parse_replication_policies_response,
+    parse_replication_policy_response,
+    parse_replication_status_response,
+    parse_trigger_replication_response,
+)
+from objstore.exceptions import (
+    ConnectionError,
+    TimeoutError,
+)
+from objstore.models import (
+    ApplyPoliciesResponse,
+    ArchiveResponse,
+    DeleteResponse,
+    ExistsResponse,
+    GetPoliciesResponse,
+    GetReplicationPoliciesResponse,
+    GetReplicationStatusResponse,
+    HealthResponse,
+    LifecyclePolicy,
+    ListResponse,
+    Metadata,
+    PolicyResponse,
+    PutResponse,
+    ReplicationPolicy,
+    TriggerReplicationOptions,
+    TriggerReplicationResponse,
+)
+
+# Content type sent with pre-serialized JSON request bodies.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Read size for streamed downloads and uploads.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+    """Yield ``source`` from its current position in fixed-size chunks."""
+    while True:
+        chunk = source.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+class AsyncRestClient:
+    """Asynchronous REST client for go-objstore.
+
+    Mirrors :class:`~objstore.rest_client.RestClient` on top of
+    ``httpx.AsyncClient``, so many requests can be in flight at once, e.g.
+    ``await asyncio.gather(*(client.get(k) for k in keys))``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        api_version: str = "v1",
+        timeout: int = 30,
+        max_retries: int = 3,
+        token: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        tenant_id: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+    ) -> None:
+        """Initialize async REST client.
+
+        Args:
+            base_url: Base URL of the go-objstore server
+            api_version: API version to use
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed connections
+            token: Optional bearer token for Authorization header
+            headers: Optional dict of additional request headers
+            tenant_id: Optional tenant identifier (sent as X-Tenant-ID)
+            client: Optional preconfigured ``httpx.AsyncClient`` to send
+                requests through. It is used as-is (auth headers are still
+                added) and is left open by ``close()``.
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept alive.
+                The pool and retry settings are ignored when ``client`` is
+                given.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_version = api_version
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.token = token
+        self.extra_headers = headers or {}
+        self.tenant_id = tenant_id
+        # URL prefixes are fixed per client, so build them once for _url().
+        self._root_url = f"{self.base_url}/"
+        self._api_url = f"{self.base_url}/api/{api_version}/" if api_version else self._root_url
+        self._owns_client = client is None
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+            # httpx transport retries cover connection failures only.
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=max_retries)
+            client = httpx.AsyncClient(timeout=timeout, transport=transport)
+        self.client = client
+        self.client.headers.update(
+            build_auth_headers(self.token, self.tenant_id, self.extra_headers)
+        )
+
+    def _url(self, path: str) -> str:
+        """Construct full URL from path.
+
+        Args:
+            path: API path
+
+        Returns:
+            Full URL
+        """
+        path = path.lstrip("/")
+        if self.api_version and not path.startswith(self.api_version):
+            return self._api_url + path
+        return self._root_url + path
+
+    def _handle_error(self, response: httpx.Response) -> None:
+        """Handle HTTP error responses.
+
+        Args:
+            response: HTTP response
+
+        Raises:
+            ObjectStoreError: For various error conditions
+        """
+        handle_http_error(response)
+
+    async def put(
+        self,
+        key: str,
+        data: Union[bytes, BinaryIO],
+        metadata: Optional[Metadata] = None,
+    ) -> PutResponse:
+        """Upload an object.
+
+        Args:
+            key: Object key/path
+            data: Object data (bytes or file-like object)
+            metadata: Optional metadata
+
+        Returns:
+            PutResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        try:
+            headers = build_metadata_headers(metadata)
+            content: Union[bytes, AsyncIterator[bytes]]
+            if isinstance(data, bytes):
+                content = data
+            elif is_seekable(data):
+                # Stream seekable files from their current position, sized
+                # from the file, instead of reading them into memory first.
+                start = data.tell()
+                headers["Content-Length"] = str(data.seek(0, 2) - start)
+                data.seek(start)
+                content = _read_chunks(data)
+            else:
+                # Other streams, such as pipes, have no known size.
+                content = data.read()
+            response = await self.client.put(url, content=content, headers=headers)
+
+            return parse_put_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get(self, key: str) -> tuple[bytes, Metadata]:
+        """Download an object.
+
+        Args:
+            key: Object key/path
+
+        Returns:
+            Tuple of (data, metadata)
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        try:
+            response = await self.client.get(url)
+            return parse_get_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_stream(self, key: str) -> AsyncIterator[bytes]:
+        """Download an object as a stream.
+
+        Args:
+            key: Object key/path
+
+        Yields:
+            Chunks of object data
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        try:
+            async with self.client.stream("GET", url) as response:
+                if response.status_code == 200:
+                    async for chunk in response.aiter_bytes(chunk_size=_STREAM_CHUNK_SIZE):
+                        if chunk:
+                            yield chunk
+                else:
+                    await response.aread()
+                    self._handle_error(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def put_stream(
+        self,
+        key: str,
+        data: Union[bytes, BinaryIO],
+        metadata: Optional[Metadata] = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> PutResponse:
+        """Upload an object from a stream or file-like object.
+
+        Streams the data from the provided source without loading the entire
+        payload into memory, using chunked transfer encoding.
+
+        Args:
+            key: Object key/path
+            data: Byte stream or file-like object to upload
+            metadata: Optional metadata
+            chunk_size: Size of chunks to read from the source (bytes)
+
+        Returns:
+            PutResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        async def _chunked_iter(source: Union[bytes, BinaryIO]) -> AsyncIterator[bytes]:
+            """Yield fixed-size chunks from a bytes or file-like source."""
+            if isinstance(source, bytes):
+                for start in range(0, len(source), chunk_size):
+                    end = start + chunk_size
+                    yield source[start:end]
+            else:
+                while True:
+                    chunk = source.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        try:
+            response = await self.client.put(
+                url, content=_chunked_iter(data), headers=build_metadata_headers(metadata)
+            )
+
+            return parse_put_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def delete(self, key: str) -> DeleteResponse:
+        """Delete an object.
+
+        Args:
+            key: Object key/path
+
+        Returns:
+            DeleteResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        try:
+            response = await self.client.delete(url)
+            return parse_delete_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def list(
+        self,
+        prefix: str = "",
+        delimiter: str = "",
+        max_results: int = 100,
+        continue_from: Optional[str] = None,
+    ) -> ListResponse:
+        """List objects.
+
+        Args:
+            prefix: Filter objects by prefix
+            delimiter: Delimiter for hierarchical listing
+            max_results: Maximum number of results
+            continue_from: Pagination token
+
+        Returns:
+            ListResponse with matching objects
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("objects")
+
+        try:
+            response = await self.client.get(
+                url,
+                params=list_params(prefix, delimiter, max_results, continue_from),
+            )
+            return parse_list_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def exists(self, key: str) -> ExistsResponse:
+        """Check if an object exists.
+
+        Args:
+            key: Object key/path
+
+        Returns:
+            ExistsResponse indicating existence
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"objects/{key}")
+
+        try:
+            response = await self.client.head(url)
+            return parse_exists_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_metadata(self, key: str) -> Metadata:
+        """Get object metadata.
+
+        Args:
+            key: Object key/path
+
+        Returns:
+            Object metadata
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"metadata/{key}")
+
+        try:
+            response = await self.client.get(url)
+            return parse_metadata_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def update_metadata(self, key: str, metadata: Metadata) -> PolicyResponse:
+        """Update object metadata.
+
+        Args:
+            key: Object key/path
+            metadata: New metadata
+
+        Returns:
+            PolicyResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"metadata/{key}")
+
+        try:
+            response = await self.client.put(
+                url,
+                content=json_body(metadata),
+                headers=_JSON_HEADERS,
+            )
+            return parse_message_response(
+                response, PolicyResponse, (200,), "Metadata updated successfully", "Update failed"
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def health(self) -> HealthResponse:
+        """Check server health.
+
+        Returns:
+            HealthResponse with server status
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        # Health endpoint doesn't use API version prefix
+        url = f"{self.base_url}/health"
+
+        try:
+            response = await self.client.get(url)
+            return parse_health_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def archive(
+        self, key: str, destination_type: str, settings: Dict[str, str]
+    ) -> ArchiveResponse:
+        """Archive an object to a different storage backend.
+
+        Args:
+            key: Object key/path
+            destination_type: Destination backend type (e.g., "s3", "gcs", "azure")
+            settings: Backend-specific settings
+
+        Returns:
+            ArchiveResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("archive")
+
+        request_data = {
+            "key": key,
+            "destination_type": destination_type,
+            "destination_settings": settings,
+        }
+
+        try:
+            response = await self.client.post(
+                url,
+                content=json_body(request_data),
+                headers=_JSON_HEADERS,
+            )
+            return parse_message_response(
+                response, ArchiveResponse, (200,), "Object archived successfully", "Archive failed"
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def add_policy(self, policy: LifecyclePolicy) -> PolicyResponse:
+        """Add a lifecycle policy.
+
+        Args:
+            policy: Lifecycle policy to add
+
+        Returns:
+            PolicyResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("policies")
+
+        try:
+            response = await self.client.post(url, content=json_body(policy), headers=_JSON_HEADERS)
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200, 201),
+                "Policy added successfully",
+                "Add policy failed",
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def remove_policy(self, policy_id: str) -> PolicyResponse:
+        """Remove a lifecycle policy.
+
+        Args:
+            policy_id: Policy ID to remove
+
+        Returns:
+            PolicyResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"policies/{policy_id}")
+
+        try:
+            response = await self.client.delete(url)
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200,),
+                "Policy removed successfully",
+                "Remove policy failed",
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_policies(self, prefix: str = "") -> GetPoliciesResponse:
+        """Get lifecycle policies.
+
+        Args:
+            prefix: Filter policies by prefix
+
+        Returns:
+            GetPoliciesResponse with list of policies
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("policies")
+
+        try:
+            response = await self.client.get(url, params={"prefix": prefix} if prefix else {})
+            return parse_policies_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def apply_policies(self) -> ApplyPoliciesResponse:
+        """Apply all lifecycle policies.
+
+        Returns:
+            ApplyPoliciesResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("policies/apply")
+
+        try:
+            response = await self.client.post(url)
+            return parse_apply_policies_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def add_replication_policy(self, policy: ReplicationPolicy) -> PolicyResponse:
+        """Add a replication policy.
+
+        Args:
+            policy: Replication policy to add
+
+        Returns:
+            PolicyResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("replication/policies")
+
+        try:
+            response = await self.client.post(url, content=json_body(policy), headers=_JSON_HEADERS)
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200, 201),
+                "Replication policy added successfully",
+                "Add replication policy failed",
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def remove_replication_policy(self, policy_id: str) -> PolicyResponse:
+        """Remove a replication policy.
+
+        Args:
+            policy_id: Policy ID to remove
+
+        Returns:
+            PolicyResponse with operation result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"replication/policies/{policy_id}")
+
+        try:
+            response = await self.client.delete(url)
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200,),
+                "Replication policy removed successfully",
+                "Remove replication policy failed",
+            )
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_replication_policies(self) -> GetReplicationPoliciesResponse:
+        """Get all replication policies.
+
+        Returns:
+            GetReplicationPoliciesResponse with list of policies
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("replication/policies")
+
+        try:
+            response = await self.client.get(url)
+            return parse_replication_policies_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_replication_policy(self, policy_id: str) -> ReplicationPolicy:
+        """Get a specific replication policy.
+
+        Args:
+            policy_id: Policy ID to retrieve
+
+        Returns:
+            ReplicationPolicy
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"replication/policies/{policy_id}")
+
+        try:
+            response = await self.client.get(url)
+            return parse_replication_policy_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def trigger_replication(
+        self, opts: TriggerReplicationOptions
+    ) -> TriggerReplicationResponse:
+        """Trigger replication synchronization.
+
+        Args:
+            opts: Trigger options
+
+        Returns:
+            TriggerReplicationResponse with sync result
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url("replication/trigger")
+
+        try:
+            response = await self.client.post(url, content=json_body(opts), headers=_JSON_HEADERS)
+            return parse_trigger_replication_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def get_replication_status(self, policy_id: str) -> GetReplicationStatusResponse:
+        """Get replication status for a policy.
+
+        Args:
+            policy_id: Policy ID to get status for
+
+        Returns:
+            GetReplicationStatusResponse with status
+
+        Raises:
+            ObjectStoreError: On failure
+        """
+        url = self._url(f"replication/status/{policy_id}")
+
+        try:
+            response = await self.client.get(url)
+            return parse_replication_status_response(response)
+
+        except httpx.TimeoutException:
+            raise TimeoutError("Request timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Close the HTTP client, unless it was supplied by the caller."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncRestClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
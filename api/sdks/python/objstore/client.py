@@ -2,7 +2,7 @@
 
 import asyncio
 from enum import Enum
-from typing import Any, BinaryIO, Coroutine, Dict, Iterator, Optional, TypeVar, Union
+from typing import Any, AsyncIterator, BinaryIO, Coroutine, Dict, Iterator, Optional, TypeVar, Union
 
 from objstore.exceptions import ValidationError
 from objstore.grpc_client import GrpcClient
@@ -206,13 +206,23 @@ class ObjectStoreClient:
                 raise exception
             return result
         except RuntimeError:
-            # No event loop running, we can use asyncio.run
-            # But prefer reusing a loop if we have one
-            if self._event_loop is None or self._event_loop.is_closed():
-                # Use asyncio.run for cleaner loop management
-                return asyncio.run(coro)
-            else:
-                return self._event_loop.run_until_complete(coro)
+            # No event loop running: drive the coroutine on the loop owned by
+            # this client.
+            return self._owned_loop().run_until_complete(coro)
+
+    def _owned_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop this client drives QUIC calls on.
+
+        Creating it once and reusing it avoids paying loop setup/teardown on
+        every call (as asyncio.run would) and keeps httpx's pooled
+        connections bound to a single loop.
+
+        Returns:
+            The client's event loop, created on first use
+        """
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop
 
     def put(
         self,
@@ -266,23 +276,25 @@ class ObjectStoreClient:
             ObjectStoreError: On failure
         """
         if self.protocol == Protocol.QUIC:
-            import asyncio
 
-            async def _stream() -> Iterator[bytes]:
+            async def _stream() -> AsyncIterator[bytes]:
                 async for chunk in self._client.get_stream(key):
                     yield chunk
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Stream on the client's own loop, like every other QUIC call, so
+            # the download reuses its pooled connections.
+            loop = self._owned_loop()
+            async_gen = _stream()
             try:
-                async_gen = _stream()
                 while True:
                     try:
                         yield loop.run_until_complete(async_gen.__anext__())
                     except StopAsyncIteration:
                         break
             finally:
-                loop.close()
+                # Also runs when the caller stops iterating early.
+                if not loop.is_closed():
+                    loop.run_until_complete(async_gen.aclose())
         else:
             yield from self._client.get_stream(key)
 
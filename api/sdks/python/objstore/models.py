@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator, model_validator
 
 
 class HealthStatus(str, Enum):
@@ -75,6 +75,10 @@ class LifecyclePolicy(BaseModel):
             self.retention_seconds = 30 * 86400
 
 
+# Compiled once and reused to validate policy lists returned by the server.
+LP_LIST_ADAPTER: TypeAdapter[List[LifecyclePolicy]] = TypeAdapter(List[LifecyclePolicy])
+
+
 class EncryptionConfig(BaseModel):
     """Encryption configuration for a single layer."""
 
@@ -119,6 +123,9 @@ class ReplicationPolicy(BaseModel):
     )
 
 
+RP_LIST_ADAPTER: TypeAdapter[List[ReplicationPolicy]] = TypeAdapter(List[ReplicationPolicy])
+
+
 class ListResponse(BaseModel):
     """List objects response."""
 
@@ -23,6 +23,7 @@ from objstore.models import (
     HealthStatus,
     LifecyclePolicy,
     ListResponse,
+    LP_LIST_ADAPTER,
     Metadata,
     ObjectInfo,
     PolicyResponse,
@@ -804,9 +805,7 @@ class QuicClient:
 
             if response.status_code == 200:
                 data = response.json()
-                policies = [
-                    LifecyclePolicy(**policy_data) for policy_data in data.get("policies", [])
-                ]
+                policies = LP_LIST_ADAPTER.validate_python(data.get("policies", []))
                 return GetPoliciesResponse(
                     policies=policies,
                     success=True,
@@ -1,40 +1,69 @@
 """REST client implementation for go-objstore."""
 
-import json
-from io import BytesIO
-from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-from objstore._http import build_auth_headers, handle_http_error
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from objstore._http import (
+    build_auth_headers,
+    build_metadata_headers,
+    handle_http_error,
+    is_seekable,
+    json_body,
+    list_params,
+    parse_apply_policies_response,
+    parse_delete_response,
+    parse_exists_response,
+    parse_get_response,
+    parse_health_response,
+    parse_list_response,
+    parse_message_response,
+    parse_metadata_response,
+    parse_policies_response,
+    parse_put_response,
+    parse_replication_policies_response,
+    parse_replication_policy_response,
+    parse_replication_status_response,
+    parse_trigger_replication_response,
+)
 from objstore.exceptions import (
     ConnectionError,
-    ObjectNotFoundError,
     TimeoutError,
 )
 from objstore.models import (
-    ArchiveResponse,
     ApplyPoliciesResponse,
+    ArchiveResponse,
     DeleteResponse,
     ExistsResponse,
     GetPoliciesResponse,
     GetReplicationPoliciesResponse,
     GetReplicationStatusResponse,
     HealthResponse,
-    HealthStatus,
     LifecyclePolicy,
     ListResponse,
     Metadata,
-    ObjectInfo,
     PolicyResponse,
     PutResponse,
     ReplicationPolicy,
-    SyncResult,
     TriggerReplicationOptions,
     TriggerReplicationResponse,
 )
 
+# Transient server-side statuses retried by the session adapter for idempotent
+# methods only. POST is left out because archive, policy and replication calls
+# must not be replayed after the server has acted on them; DELETE because the
+# server answers 500 for a missing key, which delete() maps to
+# ObjectNotFoundError. Failed connections are still retried for every method.
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT"})
+
+# Read size for streamed downloads.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class RestClient:
     """REST client for go-objstore."""
@@ -48,6 +77,9 @@ class RestClient:
         token: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
         tenant_id: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 50,
+        pool_maxsize: int = 100,
     ) -> None:
         """Initialize REST client.
 
@@ -55,10 +87,20 @@ class RestClient:
             base_url: Base URL of the go-objstore server
             api_version: API version to use
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of retries for connection failures
+                and 5xx responses, with jittered exponential backoff
             token: Optional bearer token for Authorization header
             headers: Optional dict of additional request headers
             tenant_id: Optional tenant identifier (sent as X-Tenant-ID)
+            session: Optional preconfigured ``requests.Session`` to send
+                requests through. It is used as-is (auth headers are still
+                added) and is left open by ``close()``; by default the client
+                creates and owns a pooled session.
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections kept per host. Size
+                it to the number of threads sharing the client; lower it if
+                the server rate-limits connections per client IP. The pool
+                and retry settings are ignored when ``session`` is given.
         """
         self.base_url = base_url.rstrip("/")
         self.api_version = api_version
@@ -67,17 +109,86 @@ class RestClient:
         self.token = token
         self.extra_headers = headers or {}
         self.tenant_id = tenant_id
-        self.session = requests.Session()
+        # URL prefixes are fixed per client, so build them once for _url().
+        self._root_url = f"{self.base_url}/"
+        self._api_url = f"{self.base_url}/api/{api_version}/" if api_version else self._root_url
+        self._owns_session = session is None
+        self._retry: Optional[Retry] = None
+        if session is None:
+            self._retry = self._new_retry(max_retries)
+            self.session = self._new_session(pool_connections, pool_maxsize, self._retry)
+            # put_stream sends a one-shot generator that urllib3 cannot rewind,
+            # so its session only retries connection failures and put_stream
+            # retries 5xx responses itself with a fresh body.
+            self._upload_session = self._new_session(
+                pool_connections,
+                pool_maxsize,
+                self._retry.new(status_forcelist=None, respect_retry_after_header=False),
+            )
+        else:
+            self.session = self._upload_session = session
         self._apply_session_headers()
 
+    @staticmethod
+    def _new_retry(max_retries: int) -> Retry:
+        """Build the retry policy for failed connections and 5xx responses.
+
+        Backoff is exponential with jitter and honours ``Retry-After``. Read
+        timeouts are not retried, so they still surface as ``TimeoutError``;
+        4xx responses are terminal and go straight to error handling.
+
+        Args:
+            max_retries: Maximum number of retries per request
+
+        Returns:
+            Retry policy for the session adapters
+        """
+        return Retry(
+            total=max_retries,
+            read=False,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            backoff_max=10,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_RETRY_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+
+    @staticmethod
+    def _new_session(pool_connections: int, pool_maxsize: int, retries: Retry) -> requests.Session:
+        """Create a session whose keep-alive pool is shared by every operation.
+
+        One adapter serves both schemes so connections to the server are
+        reused across calls instead of being re-established per request.
+        urllib3 hands out the most recently returned connection first, so warm
+        sockets are reused before idle ones.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections kept per host
+            retries: Retry policy applied by the adapter
+
+        Returns:
+            Session with the pooled adapter mounted
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _apply_session_headers(self) -> None:
         """Apply auth and custom headers to the underlying session.
 
         Called once on construction so every request inherits them.
         """
-        self.session.headers.update(
-            build_auth_headers(self.token, self.tenant_id, self.extra_headers)
-        )
+        auth_headers = build_auth_headers(self.token, self.tenant_id, self.extra_headers)
+        self.session.headers.update(auth_headers)
+        if self._upload_session is not self.session:
+            self._upload_session.headers.update(auth_headers)
 
     def _url(self, path: str) -> str:
         """Construct full URL from path.
@@ -90,8 +201,8 @@ class RestClient:
         """
         path = path.lstrip("/")
         if self.api_version and not path.startswith(self.api_version):
-            return f"{self.base_url}/api/{self.api_version}/{path}"
-        return f"{self.base_url}/{path}"
+            return self._api_url + path
+        return self._root_url + path
 
     def _handle_error(self, response: requests.Response) -> None:
         """Handle HTTP error responses.
@@ -104,36 +215,6 @@ class RestClient:
         """
         handle_http_error(response)
 
-    @staticmethod
-    def _parse_custom_header(response: requests.Response) -> Dict[str, str]:
-        """Parse the custom metadata map from the X-Object-Metadata header.
-
-        The server returns custom metadata as a JSON string->string object in
-        the X-Object-Metadata response header. A missing or malformed header
-        yields an empty map.
-
-        Args:
-            response: HTTP response
-
-        Returns:
-            Custom metadata map
-        """
-        header = response.headers.get("X-Object-Metadata")
-        if not header:
-            return {}
-        try:
-            parsed = json.loads(header)
-        except (ValueError, TypeError):
-            return {}
-        if not isinstance(parsed, dict):
-            return {}
-        return {str(k): str(v) for k, v in parsed.items()}
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def put(
         self,
         key: str,
@@ -156,46 +237,23 @@ class RestClient:
         url = self._url(f"objects/{key}")
 
         try:
-            # Convert file-like objects to bytes
-            if isinstance(data, bytes):
-                body_data = data
-            else:
-                body_data = data.read()
+            # Seekable files are streamed from their current position (sized
+            # from the file) and rewound by urllib3 if the request is retried.
+            # Other streams, such as pipes, cannot be rewound, so they are read
+            # into memory first.
+            if not isinstance(data, bytes) and not is_seekable(data):
+                data = data.read()
+            headers = build_metadata_headers(metadata)
 
-            headers = {}
-            if metadata:
-                if metadata.content_type:
-                    headers["Content-Type"] = metadata.content_type
-                if metadata.content_encoding:
-                    headers["Content-Encoding"] = metadata.content_encoding
-                if metadata.custom:
-                    headers["X-Object-Metadata"] = json.dumps(metadata.custom)
+            response = self.session.put(url, data=data, headers=headers, timeout=self.timeout)
 
-            response = self.session.put(
-                url, data=body_data, headers=headers, timeout=self.timeout
-            )
-
-            if response.status_code == 201:
-                result = response.json()
-                return PutResponse(
-                    success=True,
-                    message=result.get("message", "Object uploaded successfully"),
-                    etag=result.get("data", {}).get("etag"),
-                )
-
-            self._handle_error(response)
-            return PutResponse(success=False, message="Upload failed")
+            return parse_put_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get(self, key: str) -> tuple[bytes, Metadata]:
         """Download an object.
 
@@ -212,30 +270,13 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                metadata = Metadata(
-                    content_type=response.headers.get("Content-Type"),
-                    content_encoding=response.headers.get("Content-Encoding"),
-                    size=int(response.headers.get("Content-Length", 0)),
-                    etag=response.headers.get("ETag"),
-                    custom=self._parse_custom_header(response),
-                )
-                return response.content, metadata
-
-            self._handle_error(response)
-            return b"", Metadata()
+            return parse_get_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_stream(self, key: str) -> Iterator[bytes]:
         """Download an object as a stream.
 
@@ -253,23 +294,52 @@ class RestClient:
         try:
             response = self.session.get(url, stream=True, timeout=self.timeout)
 
-            if response.status_code == 200:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        yield chunk
-            else:
-                self._handle_error(response)
+            # Closing the response (also when the caller stops iterating early)
+            # hands the connection back to the pool.
+            with response:
+                if response.status_code == 200:
+                    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                        if chunk:
+                            yield chunk
+                else:
+                    self._handle_error(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
+    def get_many(
+        self, keys: Iterable[str], max_workers: int = 16
+    ) -> Iterator[Tuple[str, bytes, Metadata]]:
+        """Download several objects concurrently.
+
+        Each key is fetched with ``get()`` on a thread pool sharing this
+        client's session, so round trips overlap instead of running one after
+        another. Keep ``max_workers`` at or below ``pool_maxsize``, otherwise
+        the extra threads open connections that are discarded afterwards.
+
+        Args:
+            keys: Object keys/paths to download
+            max_workers: Maximum number of requests in flight
+
+        Yields:
+            Tuples of (key, data, metadata) in completion order, not key order
+
+        Raises:
+            ObjectStoreError: On the first failed download; requests not yet
+                started are cancelled
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {executor.submit(self.get, key): key for key in keys}
+            for future in as_completed(futures):
+                data, metadata = future.result()
+                yield futures[future], data, metadata
+        finally:
+            # Also runs when the caller stops iterating early.
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def put_stream(
         self,
         key: str,
@@ -281,6 +351,9 @@ class RestClient:
 
         Streams the data directly from the provided source without loading
         the entire payload into memory, using chunked transfer encoding.
+        5xx responses are retried with the body replayed from its starting
+        position when ``data`` is bytes or a seekable file; other streams
+        cannot be replayed and are sent once.
 
         Args:
             key: Object key/path
@@ -308,45 +381,49 @@ class RestClient:
                         break
                     yield chunk
 
-        try:
-            headers: Dict[str, str] = {}
-            if metadata:
-                if metadata.content_type:
-                    headers["Content-Type"] = metadata.content_type
-                if metadata.content_encoding:
-                    headers["Content-Encoding"] = metadata.content_encoding
-                if metadata.custom:
-                    headers["X-Object-Metadata"] = json.dumps(metadata.custom)
-
-            response = self.session.put(
-                url,
-                data=_chunked_iter(data),
-                headers=headers,
-                timeout=self.timeout,
-                stream=True,
-            )
+        # A 5xx is only retried when the source can be replayed from the start.
+        if isinstance(data, bytes):
+            start: Optional[int] = 0
+        elif self._retry is not None and is_seekable(data):
+            start = data.tell()
+        else:
+            start = None
+        retry = self._retry
 
-            if response.status_code == 201:
-                result = response.json()
-                return PutResponse(
-                    success=True,
-                    message=result.get("message", "Object uploaded successfully"),
-                    etag=result.get("data", {}).get("etag"),
+        try:
+            headers = build_metadata_headers(metadata)
+
+            while True:
+                response = self._upload_session.put(
+                    url,
+                    data=_chunked_iter(data),
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=True,
                 )
+                has_retry_after = "Retry-After" in response.headers
+                if (
+                    retry is None
+                    or start is None
+                    or not retry.is_retry("PUT", response.status_code, has_retry_after)
+                ):
+                    break
+                try:
+                    retry = retry.increment("PUT", url, response=response.raw)
+                except MaxRetryError:
+                    break
+                response.close()
+                retry.sleep(response.raw)
+                if not isinstance(data, bytes):
+                    data.seek(start)
 
-            self._handle_error(response)
-            return PutResponse(success=False, message="Upload failed")
+            return parse_put_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def delete(self, key: str) -> DeleteResponse:
         """Delete an object.
 
@@ -363,42 +440,13 @@ class RestClient:
 
         try:
             response = self.session.delete(url, timeout=self.timeout)
-
-            # The server returns 204 No Content (no body); tolerate 200 + JSON
-            # from older servers.
-            if response.status_code == 204:
-                return DeleteResponse(success=True, message="Object deleted successfully")
-
-            if response.status_code == 200:
-                result = response.json()
-                return DeleteResponse(
-                    success=True, message=result.get("message", "Object deleted successfully")
-                )
-
-            # Handle server returning 500 for non-existent objects (should be 404)
-            if response.status_code == 500:
-                # Check if it's a "not found" error
-                try:
-                    error_data = response.json()
-                    message = error_data.get("message", "").lower()
-                    if "not found" in message or "does not exist" in message:
-                        raise ObjectNotFoundError("Object not found")
-                except (ValueError, KeyError):
-                    pass
-
-            self._handle_error(response)
-            return DeleteResponse(success=False, message="Delete failed")
+            return parse_delete_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def list(
         self,
         prefix: str = "",
@@ -421,51 +469,20 @@ class RestClient:
             ObjectStoreError: On failure
         """
         url = self._url("objects")
-        params: Dict[str, Union[str, int]] = {"limit": max_results}
-
-        if prefix:
-            params["prefix"] = prefix
-        if delimiter:
-            params["delimiter"] = delimiter
-        if continue_from:
-            params["token"] = continue_from
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                objects = [
-                    ObjectInfo(
-                        key=obj["key"],
-                        metadata=Metadata(
-                            size=obj.get("size"),
-                            etag=obj.get("etag"),
-                            custom=obj.get("metadata", {}),
-                        ),
-                    )
-                    for obj in data.get("objects", [])
-                ]
-                return ListResponse(
-                    objects=objects,
-                    common_prefixes=data.get("common_prefixes", []),
-                    next_token=data.get("next_token"),
-                    truncated=data.get("truncated", False),
-                )
-
-            self._handle_error(response)
-            return ListResponse()
+            response = self.session.get(
+                url,
+                params=list_params(prefix, delimiter, max_results, continue_from),
+                timeout=self.timeout,
+            )
+            return parse_list_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def exists(self, key: str) -> ExistsResponse:
         """Check if an object exists.
 
@@ -482,26 +499,13 @@ class RestClient:
 
         try:
             response = self.session.head(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                return ExistsResponse(exists=True)
-
-            if response.status_code == 404:
-                return ExistsResponse(exists=False)
-
-            self._handle_error(response)
-            return ExistsResponse(exists=False)
+            return parse_exists_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_metadata(self, key: str) -> Metadata:
         """Get object metadata.
 
@@ -518,40 +522,13 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                # Custom metadata is carried in the X-Object-Metadata response
-                # header (JSON string->string map). The /metadata/{key} body
-                # also returns the custom map under the "metadata" key, so fall
-                # back to that when the header is absent.
-                custom = self._parse_custom_header(response)
-                if not custom:
-                    body_custom = data.get("metadata")
-                    if isinstance(body_custom, dict):
-                        custom = {str(k): str(v) for k, v in body_custom.items()}
-                return Metadata(
-                    content_type=data.get("content_type")
-                    or response.headers.get("Content-Type"),
-                    content_encoding=response.headers.get("Content-Encoding"),
-                    size=data.get("size"),
-                    etag=data.get("etag"),
-                    custom=custom,
-                )
-
-            self._handle_error(response)
-            return Metadata()
+            return parse_metadata_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def update_metadata(self, key: str, metadata: Metadata) -> PolicyResponse:
         """Update object metadata.
 
@@ -570,30 +547,19 @@ class RestClient:
         try:
             response = self.session.put(
                 url,
-                json=metadata.model_dump(exclude_none=True),
+                data=json_body(metadata),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
-
-            if response.status_code == 200:
-                result = response.json()
-                return PolicyResponse(
-                    success=True, message=result.get("message", "Metadata updated successfully")
-                )
-
-            self._handle_error(response)
-            return PolicyResponse(success=False, message="Update failed")
+            return parse_message_response(
+                response, PolicyResponse, (200,), "Metadata updated successfully", "Update failed"
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def health(self) -> HealthResponse:
         """Check server health.
 
@@ -608,30 +574,13 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                status_str = data.get("status", "UNKNOWN").upper()
-                try:
-                    status = HealthStatus(status_str)
-                except ValueError:
-                    status = HealthStatus.UNKNOWN
-
-                return HealthResponse(status=status, message=data.get("message"))
-
-            self._handle_error(response)
-            return HealthResponse(status=HealthStatus.UNKNOWN)
+            return parse_health_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def archive(self, key: str, destination_type: str, settings: Dict[str, str]) -> ArchiveResponse:
         """Archive an object to a different storage backend.
 
@@ -648,39 +597,28 @@ class RestClient:
         """
         url = self._url("archive")
 
-        try:
-            request_data = {
-                "key": key,
-                "destination_type": destination_type,
-                "destination_settings": settings,
-            }
+        request_data = {
+            "key": key,
+            "destination_type": destination_type,
+            "destination_settings": settings,
+        }
 
+        try:
             response = self.session.post(
                 url,
-                json=request_data,
+                data=json_body(request_data),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
-
-            if response.status_code == 200:
-                result = response.json()
-                return ArchiveResponse(
-                    success=True, message=result.get("message", "Object archived successfully")
-                )
-
-            self._handle_error(response)
-            return ArchiveResponse(success=False, message="Archive failed")
+            return parse_message_response(
+                response, ArchiveResponse, (200,), "Object archived successfully", "Archive failed"
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def add_policy(self, policy: LifecyclePolicy) -> PolicyResponse:
         """Add a lifecycle policy.
 
@@ -698,30 +636,23 @@ class RestClient:
         try:
             response = self.session.post(
                 url,
-                json=policy.model_dump(exclude_none=True),
+                data=json_body(policy),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
-
-            if response.status_code in (200, 201):
-                result = response.json()
-                return PolicyResponse(
-                    success=True, message=result.get("message", "Policy added successfully")
-                )
-
-            self._handle_error(response)
-            return PolicyResponse(success=False, message="Add policy failed")
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200, 201),
+                "Policy added successfully",
+                "Add policy failed",
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def remove_policy(self, policy_id: str) -> PolicyResponse:
         """Remove a lifecycle policy.
 
@@ -738,26 +669,19 @@ class RestClient:
 
         try:
             response = self.session.delete(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                result = response.json()
-                return PolicyResponse(
-                    success=True, message=result.get("message", "Policy removed successfully")
-                )
-
-            self._handle_error(response)
-            return PolicyResponse(success=False, message="Remove policy failed")
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200,),
+                "Policy removed successfully",
+                "Remove policy failed",
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_policies(self, prefix: str = "") -> GetPoliciesResponse:
         """Get lifecycle policies.
 
@@ -771,37 +695,20 @@ class RestClient:
             ObjectStoreError: On failure
         """
         url = self._url("policies")
-        params = {}
-        if prefix:
-            params["prefix"] = prefix
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                policies = [
-                    LifecyclePolicy(**policy_data) for policy_data in data.get("policies", [])
-                ]
-                return GetPoliciesResponse(
-                    policies=policies,
-                    success=True,
-                    message=data.get("message", "Policies retrieved successfully"),
-                )
-
-            self._handle_error(response)
-            return GetPoliciesResponse(policies=[], success=False, message="Get policies failed")
+            response = self.session.get(
+                url,
+                params={"prefix": prefix} if prefix else {},
+                timeout=self.timeout,
+            )
+            return parse_policies_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def apply_policies(self) -> ApplyPoliciesResponse:
         """Apply all lifecycle policies.
 
@@ -815,31 +722,13 @@ class RestClient:
 
         try:
             response = self.session.post(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                return ApplyPoliciesResponse(
-                    success=True,
-                    policies_count=data.get("policies_count", 0),
-                    objects_processed=data.get("objects_processed", 0),
-                    message=data.get("message", "Policies applied successfully"),
-                )
-
-            self._handle_error(response)
-            return ApplyPoliciesResponse(
-                success=False, policies_count=0, objects_processed=0, message="Apply policies failed"
-            )
+            return parse_apply_policies_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def add_replication_policy(self, policy: ReplicationPolicy) -> PolicyResponse:
         """Add a replication policy.
 
@@ -857,30 +746,23 @@ class RestClient:
         try:
             response = self.session.post(
                 url,
-                json=policy.model_dump(exclude_none=True),
+                data=json_body(policy),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
-
-            if response.status_code in (200, 201):
-                result = response.json()
-                return PolicyResponse(
-                    success=True, message=result.get("message", "Replication policy added successfully")
-                )
-
-            self._handle_error(response)
-            return PolicyResponse(success=False, message="Add replication policy failed")
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200, 201),
+                "Replication policy added successfully",
+                "Add replication policy failed",
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def remove_replication_policy(self, policy_id: str) -> PolicyResponse:
         """Remove a replication policy.
 
@@ -897,26 +779,19 @@ class RestClient:
 
         try:
             response = self.session.delete(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                result = response.json()
-                return PolicyResponse(
-                    success=True, message=result.get("message", "Replication policy removed successfully")
-                )
-
-            self._handle_error(response)
-            return PolicyResponse(success=False, message="Remove replication policy failed")
+            return parse_message_response(
+                response,
+                PolicyResponse,
+                (200,),
+                "Replication policy removed successfully",
+                "Remove replication policy failed",
+            )
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_replication_policies(self) -> GetReplicationPoliciesResponse:
         """Get all replication policies.
 
@@ -930,27 +805,13 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                policies = [
-                    ReplicationPolicy(**policy_data) for policy_data in data.get("policies", [])
-                ]
-                return GetReplicationPoliciesResponse(policies=policies)
-
-            self._handle_error(response)
-            return GetReplicationPoliciesResponse(policies=[])
+            return parse_replication_policies_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_replication_policy(self, policy_id: str) -> ReplicationPolicy:
         """Get a specific replication policy.
 
@@ -967,30 +828,13 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                # The server responds with a bare ReplicationPolicyResponse
-                # object (no "policy" wrapper key).
-                return ReplicationPolicy(**data)
-
-            self._handle_error(response)
-            return ReplicationPolicy(
-                id="",
-                source_backend="",
-                destination_backend="",
-            )
+            return parse_replication_policy_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def trigger_replication(self, opts: TriggerReplicationOptions) -> TriggerReplicationResponse:
         """Trigger replication synchronization.
 
@@ -1008,36 +852,17 @@ class RestClient:
         try:
             response = self.session.post(
                 url,
-                json=opts.model_dump(exclude_none=True),
+                data=json_body(opts),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
-
-            if response.status_code == 200:
-                data = response.json()
-                result_data = data.get("result")
-                sync_result = SyncResult(**result_data) if result_data else None
-                return TriggerReplicationResponse(
-                    success=True,
-                    result=sync_result,
-                    message=data.get("message", "Replication triggered successfully"),
-                )
-
-            self._handle_error(response)
-            return TriggerReplicationResponse(
-                success=False, result=None, message="Trigger replication failed"
-            )
+            return parse_trigger_replication_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def get_replication_status(self, policy_id: str) -> GetReplicationStatusResponse:
         """Get replication status for a policy.
 
@@ -1054,24 +879,7 @@ class RestClient:
 
         try:
             response = self.session.get(url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                data = response.json()
-                from objstore.models import ReplicationStatus
-
-                # The server responds with a bare ReplicationStatusResponse
-                # object (no "status" wrapper key).
-                status = ReplicationStatus(**data)
-                return GetReplicationStatusResponse(
-                    success=True,
-                    status=status,
-                    message="Status retrieved successfully",
-                )
-
-            self._handle_error(response)
-            return GetReplicationStatusResponse(
-                success=False, status=None, message="Get replication status failed"
-            )
+            return parse_replication_status_response(response)
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Request timed out")
@@ -1079,8 +887,10 @@ class RestClient:
             raise ConnectionError(f"Connection failed: {str(e)}")
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Close the HTTP sessions, unless they were supplied by the caller."""
+        if self._owns_session:
+            self.session.close()
+            self._upload_session.close()
 
     def __enter__(self) -> "RestClient":
         """Context manager entry."""
@@ -25,16 +25,21 @@ setup(
         "typing-extensions>=4.9.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=9.0.3",
             "pytest-cov>=4.1.0",
-            "pytest-asyncio>=0.23.2",
+            "pytest-asyncio>=1.4.0",
             "pytest-mock>=3.12.0",
+            "pytest-xdist>=3.5.0",
             "black>=26.5.1",
             "flake8>=7.0.0",
             "mypy>=1.8.0",
             "isort>=5.13.2",
             "responses>=0.24.1",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
         ],
     },
     classifiers=[
@@ -1,14 +1,138 @@
 """Shared pytest fixtures for unit tests."""
 
+import sys
+from typing import Callable, Iterator, Mapping
+
 import pytest
+import responses
+
+from objstore.models import LifecyclePolicy, ReplicationPolicy, ReplicationStatus, SyncResult
+from objstore.rest_client import RestClient
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
+
+# Minimal valid payloads for the models on the policy/replication parse paths.
+_WARMUP_MODELS = (
+    (LifecyclePolicy, {"id": "_", "prefix": "", "action": "delete"}),
+    (
+        ReplicationPolicy,
+        {"id": "_", "source_backend": "", "destination_backend": "", "check_interval_seconds": 0},
+    ),
+    (
+        ReplicationStatus,
+        {
+            "policy_id": "_",
+            "source_backend": "",
+            "destination_backend": "",
+            "enabled": True,
+            "total_objects_synced": 0,
+            "total_objects_deleted": 0,
+            "total_bytes_synced": 0,
+            "total_errors": 0,
+            "average_sync_duration": "1s",
+            "sync_count": 0,
+        },
+    ),
+    (
+        SyncResult,
+        {
+            "policy_id": "_",
+            "synced": 0,
+            "deleted": 0,
+            "failed": 0,
+            "bytes_total": 0,
+            "duration": "1s",
+        },
+    ),
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Validate each policy/replication model once before any test runs.
+
+    Pydantic builds the core schemas at import, but the first validation of
+    each model still warms the Python-side hooks (post-init, Go-duration
+    parsing). Doing it here, once per xdist worker, keeps that one-off cost out
+    of whichever test happens to run first.
+    """
+    for model, fields in _WARMUP_MODELS:
+        model.model_validate(fields)
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> Mapping[str, Callable[[], object]]:
+        """Run the async tests on uvloop when it is installed.
+
+        Every ``AsyncMock`` await goes through the event loop, so libuv's loop
+        trims per-test overhead on the QUIC client suite. Without uvloop (or on
+        Windows, where it is unavailable) pytest-asyncio's default loop is used.
+        """
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture(autouse=True)
 def _no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
     """Make tenacity retries instantaneous.
 
-    The REST client decorates every operation with an exponential-backoff
+    The MCP client decorates every operation with an exponential-backoff
     retry. Patching tenacity's sleep keeps the retry behaviour exercised while
     removing the real wall-clock delay from the test suite.
     """
     monkeypatch.setattr("tenacity.nap.time.sleep", lambda _seconds: None)
+
+
+@pytest.fixture(scope="session")
+def _shared_rest_client() -> Iterator[RestClient]:
+    """One default RestClient built once for the whole session.
+
+    ``responses`` patches the transport adapter rather than the session, so a
+    single instance (and its ``requests.Session``) can serve every test.
+    """
+    client = RestClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def rest_client(_shared_rest_client: RestClient) -> RestClient:
+    """The shared RestClient, with cookies left by earlier tests cleared.
+
+    Cookies are the only state a ``requests.Session`` picks up from canned
+    responses; clearing them keeps each test independent of the others.
+    """
+    _shared_rest_client.session.cookies.clear()
+    return _shared_rest_client
+
+
+@pytest.fixture(scope="module")
+def _requests_mock() -> Iterator[responses.RequestsMock]:
+    """Patch the requests transport once for the whole test module.
+
+    ``@responses.activate`` installs and removes the ``HTTPAdapter.send``
+    patch around every test; sharing one mock per module pays that cost once.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def rsps(_requests_mock: responses.RequestsMock) -> Iterator[responses.RequestsMock]:
+    """Module-wide ``RequestsMock``, cleared before and after each test.
+
+    ``reset()`` drops the registered responses and recorded calls without
+    re-patching the transport adapter. Resetting on entry as well as exit means
+    a test never sees stubs or calls left by another one, even if that test
+    used ``_requests_mock`` directly or its teardown was skipped.
+    """
+    _requests_mock.reset()
+    try:
+        yield _requests_mock
+    finally:
+        _requests_mock.reset()
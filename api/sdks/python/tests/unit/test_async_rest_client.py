@@ -0,0 +1,473 @@
+"""Unit tests for the asynchronous REST client.
+
+The transport is an ``httpx.MockTransport`` serving a per-test route table,
+so no live server is needed. Wire formats match the synchronous REST tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from objstore.async_rest_client import AsyncRestClient
+from objstore.exceptions import (
+    AlreadyExistsError,
+    AuthenticationError,
+    AuthorizationError,
+    ConnectionError,
+    ObjectNotFoundError,
+    ObjectStoreError,
+    RateLimitError,
+    ServerError,
+    TimeoutError,
+    ValidationError,
+)
+from objstore.models import (
+    HealthStatus,
+    LifecyclePolicy,
+    Metadata,
+    ReplicationPolicy,
+    TriggerReplicationOptions,
+)
+
+pytestmark = pytest.mark.asyncio
+
+BASE = "http://localhost:8080"
+
+# (method, path) -> canned response, or an exception to raise from the transport.
+Routes = Dict[Tuple[str, str], Union[httpx.Response, Exception]]
+
+
+def _json(status: int, body: object) -> httpx.Response:
+    return httpx.Response(
+        status, content=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+    )
+
+
+async def _drain(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([c async for c in chunks])
+
+
+_POLICY = LifecyclePolicy(id="p1", prefix="x/", retention_seconds=10, action="delete")
+_REPL_POLICY = ReplicationPolicy(id="r1", source_backend="local", destination_backend="s3")
+
+# (method, path, call) for every operation, so each error branch is exercised.
+_OPERATIONS: List[Tuple[str, str, Callable[[AsyncRestClient], Awaitable[Any]]]] = [
+    ("PUT", "/api/v1/objects/k", lambda c: c.put("k", b"d")),
+    ("PUT", "/api/v1/objects/k", lambda c: c.put_stream("k", b"d")),
+    ("GET", "/api/v1/objects/k", lambda c: c.get("k")),
+    ("GET", "/api/v1/objects/k", lambda c: _drain(c.get_stream("k"))),
+    ("DELETE", "/api/v1/objects/k", lambda c: c.delete("k")),
+    ("GET", "/api/v1/objects", lambda c: c.list()),
+    ("HEAD", "/api/v1/objects/k", lambda c: c.exists("k")),
+    ("GET", "/api/v1/metadata/k", lambda c: c.get_metadata("k")),
+    ("PUT", "/api/v1/metadata/k", lambda c: c.update_metadata("k", Metadata())),
+    ("GET", "/health", lambda c: c.health()),
+    ("POST", "/api/v1/archive", lambda c: c.archive("k", "s3", {})),
+    ("POST", "/api/v1/policies", lambda c: c.add_policy(_POLICY)),
+    ("DELETE", "/api/v1/policies/p1", lambda c: c.remove_policy("p1")),
+    ("GET", "/api/v1/policies", lambda c: c.get_policies()),
+    ("POST", "/api/v1/policies/apply", lambda c: c.apply_policies()),
+    ("POST", "/api/v1/replication/policies", lambda c: c.add_replication_policy(_REPL_POLICY)),
+    ("DELETE", "/api/v1/replication/policies/r1", lambda c: c.remove_replication_policy("r1")),
+    ("GET", "/api/v1/replication/policies", lambda c: c.get_replication_policies()),
+    ("GET", "/api/v1/replication/policies/r1", lambda c: c.get_replication_policy("r1")),
+    (
+        "POST",
+        "/api/v1/replication/trigger",
+        lambda c: c.trigger_replication(TriggerReplicationOptions(policy_id="r1")),
+    ),
+    ("GET", "/api/v1/replication/status/r1", lambda c: c.get_replication_status("r1")),
+]
+_OPERATION_IDS = [
+    "put",
+    "put_stream",
+    "get",
+    "get_stream",
+    "delete",
+    "list",
+    "exists",
+    "get_metadata",
+    "update_metadata",
+    "health",
+    "archive",
+    "add_policy",
+    "remove_policy",
+    "get_policies",
+    "apply_policies",
+    "add_replication_policy",
+    "remove_replication_policy",
+    "get_replication_policies",
+    "get_replication_policy",
+    "trigger_replication",
+    "get_replication_status",
+]
+
+
+@pytest.fixture
+def routes() -> Routes:
+    return {}
+
+
+@pytest.fixture
+def sent() -> List[httpx.Request]:
+    return []
+
+
+@pytest_asyncio.fixture
+async def client(routes: Routes, sent: List[httpx.Request]) -> AsyncIterator[AsyncRestClient]:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        answer = routes[(request.method, request.url.path)]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    rest = AsyncRestClient(base_url=BASE, token="tok", client=http)
+    yield rest
+    await http.aclose()
+
+
+# =====================================================================
+# object operations
+# =====================================================================
+
+
+async def test_async_rest_put_success(
+    client: AsyncRestClient, routes: Routes, sent: List[httpx.Request]
+) -> None:
+    routes["PUT", "/api/v1/objects/k"] = _json(201, {"message": "ok", "data": {"etag": "e1"}})
+    result = await client.put("k", b"data", metadata=Metadata(custom={"a": "b"}))
+    assert result.success is True
+    assert result.etag == "e1"
+    assert sent[0].content == b"data"
+    assert json.loads(sent[0].headers["X-Object-Metadata"]) == {"a": "b"}
+    assert sent[0].headers["Authorization"] == "Bearer tok"
+
+
+async def test_async_rest_put_streams_seekable_file(
+    client: AsyncRestClient, routes: Routes, sent: List[httpx.Request]
+) -> None:
+    reads: List[int] = []
+
+    class _File(io.BytesIO):
+        def read(self, size: Optional[int] = -1) -> bytes:
+            reads.append(-1 if size is None else size)
+            return super().read(size)
+
+    source = _File(b"skip" + b"x" * 200_000)
+    source.seek(4)
+    routes["PUT", "/api/v1/objects/k"] = _json(201, {"message": "ok", "data": {}})
+    assert (await client.put("k", source)).success is True
+    assert sent[0].headers["Content-Length"] == "200000"
+    assert sent[0].content == b"x" * 200_000
+    assert -1 not in reads  # read in chunks, never whole
+
+
+async def test_async_rest_put_reads_non_seekable_file(
+    client: AsyncRestClient, routes: Routes, sent: List[httpx.Request]
+) -> None:
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"piped bytes")
+    os.close(write_fd)
+    routes["PUT", "/api/v1/objects/k"] = _json(201, {"message": "ok", "data": {}})
+    with open(read_fd, "rb") as pipe:
+        assert (await client.put("k", pipe)).success is True
+    assert sent[0].content == b"piped bytes"
+
+
+async def test_async_rest_put_stream_success(
+    client: AsyncRestClient, routes: Routes, sent: List[httpx.Request]
+) -> None:
+    routes["PUT", "/api/v1/objects/k"] = _json(201, {"message": "ok", "data": {}})
+    result = await client.put_stream("k", b"abcdef", chunk_size=2)
+    assert result.success is True
+    assert sent[0].content == b"abcdef"
+
+
+async def test_async_rest_get_success(client: AsyncRestClient, routes: Routes) -> None:
+    routes["GET", "/api/v1/objects/k"] = httpx.Response(
+        200,
+        content=b"hello",
+        headers={
+            "Content-Type": "text/plain",
+            "ETag": "e1",
+            "X-Object-Metadata": '{"author": "x"}',
+        },
+    )
+    data, meta = await client.get("k")
+    assert data == b"hello"
+    assert meta.size == 5
+    assert meta.custom == {"author": "x"}
+
+
+async def test_async_rest_get_stream_success(client: AsyncRestClient, routes: Routes) -> None:
+    body = bytes(range(256)) * 1024
+    routes["GET", "/api/v1/objects/k"] = httpx.Response(200, content=body)
+    chunks = [c async for c in client.get_stream("k")]
+    assert b"".join(chunks) == body
+
+
+async def test_async_rest_get_stream_not_found(client: AsyncRestClient, routes: Routes) -> None:
+    routes["GET", "/api/v1/objects/k"] = httpx.Response(404)
+    with pytest.raises(ObjectNotFoundError):
+        async for _ in client.get_stream("k"):
+            pass
+
+
+async def test_async_rest_delete_success(client: AsyncRestClient, routes: Routes) -> None:
+    routes["DELETE", "/api/v1/objects/k"] = httpx.Response(204)
+    assert (await client.delete("k")).success is True
+
+
+async def test_async_rest_delete_500_not_found_message(
+    client: AsyncRestClient, routes: Routes
+) -> None:
+    routes["DELETE", "/api/v1/objects/k"] = _json(500, {"message": "object does not exist"})
+    with pytest.raises(ObjectNotFoundError):
+        await client.delete("k")
+
+
+async def test_async_rest_list_success(
+    client: AsyncRestClient, routes: Routes, sent: List[httpx.Request]
+) -> None:
+    routes["GET", "/api/v1/objects"] = _json(
+        200, {"objects": [{"key": "o1", "size": 1}], "common_prefixes": ["d/"], "truncated": True}
+    )
+    result = await client.list(prefix="p", max_results=10)
+    assert [o.key for o in result.objects] == ["o1"]
+    assert result.truncated is True
+    assert sent[0].url.params["prefix"] == "p"
+
+
+@pytest.mark.parametrize("status,expected", [(200, True), (404, False)])
+async def test_async_rest_exists(
+    client: AsyncRestClient, routes: Routes, status: int, expected: bool
+) -> None:
+    routes["HEAD", "/api/v1/objects/k"] = httpx.Response(status)
+    assert (await client.exists("k")).exists is expected
+
+
+async def test_async_rest_metadata_round_trip(client: AsyncRestClient, routes: Routes) -> None:
+    routes["PUT", "/api/v1/metadata/k"] = _json(200, {"message": "updated"})
+    routes["GET", "/api/v1/metadata/k"] = _json(
+        200, {"content_type": "text/plain", "size": 3, "etag": "e", "metadata": {"a": "b"}}
+    )
+    assert (await client.update_metadata("k", Metadata(custom={"a": "b"}))).success is True
+    meta = await client.get_metadata("k")
+    assert meta.content_type == "text/plain"
+    assert meta.custom == {"a": "b"}
+
+
+async def test_async_rest_health_success(client: AsyncRestClient, routes: Routes) -> None:
+    routes["GET", "/health"] = _json(200, {"status": "serving"})
+    assert (await client.health()).status == HealthStatus.SERVING
+
+
+# =====================================================================
+# archive, lifecycle and replication
+# =====================================================================
+
+
+async def test_async_rest_policy_operations(client: AsyncRestClient, routes: Routes) -> None:
+    routes["POST", "/api/v1/archive"] = _json(200, {"message": "archived"})
+    routes["POST", "/api/v1/policies"] = _json(201, {"message": "added"})
+    routes["DELETE", "/api/v1/policies/p1"] = _json(200, {"message": "removed"})
+    routes["GET", "/api/v1/policies"] = _json(
+        200,
+        {"policies": [{"id": "p1", "prefix": "x/", "retention_seconds": 10, "action": "delete"}]},
+    )
+    routes["POST", "/api/v1/policies/apply"] = _json(
+        200, {"policies_count": 1, "objects_processed": 4}
+    )
+    policy = LifecyclePolicy(id="p1", prefix="x/", retention_seconds=10, action="delete")
+    archived, added, removed, listed, applied = await asyncio.gather(
+        client.archive("k", "s3", {"bucket": "b"}),
+        client.add_policy(policy),
+        client.remove_policy("p1"),
+        client.get_policies(),
+        client.apply_policies(),
+    )
+    assert archived.success and added.success and removed.success
+    assert [p.id for p in listed.policies] == ["p1"]
+    assert applied.objects_processed == 4
+
+
+async def test_async_rest_replication_operations(client: AsyncRestClient, routes: Routes) -> None:
+    policy_json = {
+        "id": "r1",
+        "source_backend": "local",
+        "destination_backend": "s3",
+        "check_interval_seconds": 30,
+    }
+    routes["POST", "/api/v1/replication/policies"] = _json(201, {"message": "added"})
+    routes["DELETE", "/api/v1/replication/policies/r1"] = _json(200, {"message": "removed"})
+    routes["GET", "/api/v1/replication/policies"] = _json(200, {"policies": [policy_json]})
+    routes["GET", "/api/v1/replication/policies/r1"] = _json(200, policy_json)
+    routes["POST", "/api/v1/replication/trigger"] = _json(
+        200,
+        {
+            "result": {
+                "policy_id": "r1",
+                "synced": 3,
+                "deleted": 0,
+                "failed": 0,
+                "bytes_total": 9,
+                "duration": "2s",
+            }
+        },
+    )
+    routes["GET", "/api/v1/replication/status/r1"] = _json(
+        200,
+        {
+            "policy_id": "r1",
+            "source_backend": "local",
+            "destination_backend": "s3",
+            "enabled": True,
+            "total_objects_synced": 3,
+            "total_objects_deleted": 0,
+            "total_bytes_synced": 9,
+            "total_errors": 0,
+            "average_sync_duration": "1s",
+            "sync_count": 1,
+        },
+    )
+
+    added, removed, listed, fetched, triggered, status = await asyncio.gather(
+        client.add_replication_policy(ReplicationPolicy(**policy_json)),
+        client.remove_replication_policy("r1"),
+        client.get_replication_policies(),
+        client.get_replication_policy("r1"),
+        client.trigger_replication(TriggerReplicationOptions(policy_id="r1")),
+        client.get_replication_status("r1"),
+    )
+    assert added.success and removed.success
+    assert listed.policies[0].id == fetched.id == "r1"
+    assert triggered.result.duration_ms == 2000
+    assert status.status.average_sync_duration_ms == 1000
+
+
+async def test_async_rest_datetime_serializes_with_stdlib_json(
+    client: AsyncRestClient,
+    routes: Routes,
+    sent: List[httpx.Request],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from objstore._http import _stdlib_json_dumps
+
+    monkeypatch.setattr("objstore._http.json_dumps", _stdlib_json_dumps)
+    routes["POST", "/api/v1/replication/policies"] = _json(201, {"message": "added"})
+    policy = ReplicationPolicy(
+        id="r1",
+        source_backend="local",
+        destination_backend="s3",
+        last_sync_time=datetime(2024, 1, 2, tzinfo=timezone.utc),
+    )
+    assert (await client.add_replication_policy(policy)).success is True
+    assert json.loads(sent[0].content)["last_sync_time"] == "2024-01-02T00:00:00Z"
+
+
+async def test_async_rest_concurrent_fan_out(client: AsyncRestClient, routes: Routes) -> None:
+    for i in range(20):
+        routes["GET", f"/api/v1/objects/k{i}"] = httpx.Response(200, content=str(i).encode())
+    results = await asyncio.gather(*(client.get(f"k{i}") for i in range(20)))
+    assert [data for data, _ in results] == [str(i).encode() for i in range(20)]
+
+
+# =====================================================================
+# errors
+# =====================================================================
+
+
+@pytest.mark.parametrize(
+    "response,exc",
+    [
+        (httpx.Response(400, text="bad"), ValidationError),
+        (httpx.Response(401), AuthenticationError),
+        (httpx.Response(403), AuthorizationError),
+        (httpx.Response(404), ObjectNotFoundError),
+        (_json(409, {"message": "exists"}), AlreadyExistsError),
+        (httpx.Response(429), RateLimitError),
+        (_json(500, {"message": "boom"}), ServerError),
+        (httpx.Response(418, text="teapot"), ObjectStoreError),
+    ],
+    ids=lambda v: str(getattr(v, "status_code", "")) or None,
+)
+async def test_async_rest_error_mapping(
+    client: AsyncRestClient, routes: Routes, response: httpx.Response, exc: type
+) -> None:
+    routes["GET", "/api/v1/objects/k"] = response
+    with pytest.raises(exc):
+        await client.get("k")
+
+
+@pytest.mark.parametrize(
+    "error,exc",
+    [
+        (httpx.ReadTimeout("t"), TimeoutError),
+        (httpx.ConnectError("c"), ConnectionError),
+    ],
+)
+async def test_async_rest_transport_errors(
+    client: AsyncRestClient, routes: Routes, error: Exception, exc: type
+) -> None:
+    routes["GET", "/api/v1/objects/k"] = error
+    with pytest.raises(exc):
+        await client.get("k")
+
+
+@pytest.mark.parametrize("method,path,call", _OPERATIONS, ids=_OPERATION_IDS)
+@pytest.mark.parametrize(
+    "answer,exc",
+    [
+        (httpx.ReadTimeout("t"), TimeoutError),
+        (httpx.ConnectError("c"), ConnectionError),
+        (httpx.Response(403), AuthorizationError),
+        (_json(500, {"message": "boom"}), ServerError),
+    ],
+    ids=["timeout", "connect_error", "4xx", "5xx"],
+)
+async def test_async_rest_operation_errors(
+    client: AsyncRestClient,
+    routes: Routes,
+    method: str,
+    path: str,
+    call: Callable[[AsyncRestClient], Awaitable[Any]],
+    answer: Union[httpx.Response, Exception],
+    exc: type,
+) -> None:
+    routes[method, path] = answer
+    with pytest.raises(exc):
+        await call(client)
+
+
+# =====================================================================
+# construction and lifecycle
+# =====================================================================
+
+
+async def test_async_rest_url_construction() -> None:
+    rest = AsyncRestClient(base_url=f"{BASE}/", client=httpx.AsyncClient())
+    assert rest._url("objects/k") == f"{BASE}/api/v1/objects/k"
+    await rest.client.aclose()
+
+
+async def test_async_rest_injected_client_left_open(client: AsyncRestClient) -> None:
+    async with client:
+        pass
+    assert client.client.is_closed is False
+
+
+async def test_async_rest_owned_client_closed_on_exit() -> None:
+    async with AsyncRestClient(base_url=BASE) as rest:
+        pass
+    assert rest.client.is_closed is True
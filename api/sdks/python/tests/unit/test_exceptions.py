@@ -1,5 +1,7 @@
 """Unit tests for exceptions."""
 
+from typing import Callable, Optional
+
 import pytest
 
 from objstore.exceptions import (
@@ -19,12 +21,42 @@ from objstore.exceptions import (
 class TestExceptions:
     """Test exception classes."""
 
-    def test_object_store_error(self) -> None:
-        """Test base ObjectStoreError."""
-        error = ObjectStoreError("test error", status_code=500)
-        assert str(error) == "test error"
-        assert error.message == "test error"
-        assert error.status_code == 500
+    @pytest.mark.parametrize(
+        "factory,message,status_code",
+        [
+            (lambda: ObjectStoreError("test error", status_code=500), "test error", 500),
+            (lambda: ConnectionError("connection failed"), "connection failed", None),
+            (lambda: AuthenticationError("invalid token"), "invalid token", 401),
+            (lambda: AuthorizationError("access denied"), "access denied", 403),
+            (lambda: AlreadyExistsError("object already exists"), "object already exists", 409),
+            (lambda: RateLimitError("too many requests"), "too many requests", 429),
+            (lambda: ValidationError("invalid input"), "invalid input", 400),
+            (lambda: ServerError("internal error", status_code=503), "internal error", 503),
+            (lambda: TimeoutError("request timeout"), "request timeout", None),
+        ],
+        ids=[
+            "object_store",
+            "connection",
+            "authentication",
+            "authorization",
+            "already_exists",
+            "rate_limit",
+            "validation",
+            "server",
+            "timeout",
+        ],
+    )
+    def test_error_message_and_status(
+        self,
+        factory: Callable[[], ObjectStoreError],
+        message: str,
+        status_code: Optional[int],
+    ) -> None:
+        """Test message and status code of each exception type."""
+        error = factory()
+        assert str(error) == message
+        assert error.message == message
+        assert error.status_code == status_code
 
     def test_object_not_found_error(self) -> None:
         """Test ObjectNotFoundError."""
@@ -33,52 +65,6 @@ class TestExceptions:
         assert error.key == "my-key"
         assert error.status_code == 404
 
-    def test_connection_error(self) -> None:
-        """Test ConnectionError."""
-        error = ConnectionError("connection failed")
-        assert str(error) == "connection failed"
-
-    def test_authentication_error(self) -> None:
-        """Test AuthenticationError."""
-        error = AuthenticationError("invalid token")
-        assert str(error) == "invalid token"
-        assert error.status_code == 401
-
-    def test_authorization_error(self) -> None:
-        """Test AuthorizationError."""
-        error = AuthorizationError("access denied")
-        assert str(error) == "access denied"
-        assert error.status_code == 403
-
-    def test_already_exists_error(self) -> None:
-        """Test AlreadyExistsError."""
-        error = AlreadyExistsError("object already exists")
-        assert str(error) == "object already exists"
-        assert error.status_code == 409
-
-    def test_rate_limit_error(self) -> None:
-        """Test RateLimitError."""
-        error = RateLimitError("too many requests")
-        assert str(error) == "too many requests"
-        assert error.status_code == 429
-
-    def test_validation_error(self) -> None:
-        """Test ValidationError."""
-        error = ValidationError("invalid input")
-        assert str(error) == "invalid input"
-        assert error.status_code == 400
-
-    def test_server_error(self) -> None:
-        """Test ServerError."""
-        error = ServerError("internal error", status_code=503)
-        assert str(error) == "internal error"
-        assert error.status_code == 503
-
-    def test_timeout_error(self) -> None:
-        """Test TimeoutError."""
-        error = TimeoutError("request timeout")
-        assert str(error) == "request timeout"
-
     def test_exception_inheritance(self) -> None:
         """Test exception inheritance."""
         assert issubclass(ObjectNotFoundError, ObjectStoreError)
@@ -1,161 +1,150 @@
 """Unit tests for lifecycle and replication operations."""
 
+from datetime import datetime, timezone
+from typing import Any, Callable
+
 import pytest
 import responses
-from datetime import datetime
+from responses import matchers
 
+from objstore._http import json_dumps
 from objstore.models import (
-    ApplyPoliciesResponse,
-    ArchiveResponse,
-    GetPoliciesResponse,
-    GetReplicationPoliciesResponse,
-    GetReplicationStatusResponse,
     LifecyclePolicy,
-    PolicyResponse,
-    ReplicationMode,
     ReplicationPolicy,
     ReplicationStatus,
     SyncResult,
     TriggerReplicationOptions,
-    TriggerReplicationResponse,
 )
 from objstore.rest_client import RestClient
 
+_API = "http://localhost:8080/api/v1"
 
-class TestLifecyclePolicies:
-    """Test cases for lifecycle policy operations."""
-
-    @responses.activate
-    def test_archive(self) -> None:
-        """Test archive operation."""
-        responses.add(
-            responses.POST,
-            "http://localhost:8080/api/v1/archive",
-            json={"success": True, "message": "Object archived successfully"},
-            status=200,
-        )
-
-        client = RestClient()
-        result = client.archive("test-key", "s3", {"bucket": "archive-bucket"})
-
-        assert result.success is True
-        assert "archived" in result.message.lower()
-
-    @responses.activate
-    def test_add_policy(self) -> None:
-        """Test add lifecycle policy."""
-        responses.add(
-            responses.POST,
-            "http://localhost:8080/api/v1/policies",
-            json={"success": True, "message": "Policy added successfully"},
-            status=201,
-        )
-
-        client = RestClient()
-        policy = LifecyclePolicy(
-            id="policy-1",
-            prefix="logs/",
-            retention_seconds=86400,
-            action="delete",
-        )
-        result = client.add_policy(policy)
+# Timestamp shared by the status fixtures; matches "last_sync_time" in _STATUS_BODY.
+_FIXED_TS = datetime(2025, 11, 25, 10, 0, 0, tzinfo=timezone.utc)
 
-        assert result.success is True
-        assert "added" in result.message.lower()
-
-    @responses.activate
-    def test_remove_policy(self) -> None:
-        """Test remove lifecycle policy."""
-        responses.add(
-            responses.DELETE,
-            "http://localhost:8080/api/v1/policies/policy-1",
-            json={"success": True, "message": "Policy removed successfully"},
-            status=200,
-        )
+# Request models are only read by the client, so they are validated once here.
+_LIFECYCLE_POLICY = LifecyclePolicy(
+    id="policy-1", prefix="logs/", retention_seconds=86400, action="delete"
+)
+_REPL_POLICY = ReplicationPolicy(
+    id="repl-1",
+    source_backend="local",
+    source_settings={"path": "/data"},
+    destination_backend="s3",
+    destination_settings={"bucket": "backup"},
+    check_interval_seconds=300,
+    enabled=True,
+)
+_TRIGGER_OPTS = TriggerReplicationOptions(policy_id="repl-1", parallel=True, worker_count=4)
+
+# Canned response bodies, serialized once at import with the client's own JSON
+# encoder instead of being rebuilt as dicts and re-encoded on every test.
+_POLICIES_BODY = json_dumps(
+    {
+        "policies": [
+            {
+                "id": "policy-1",
+                "prefix": "logs/",
+                "retention_seconds": 86400,
+                "action": "delete",
+                "destination_type": None,
+                "destination_settings": {},
+            }
+        ],
+        "success": True,
+        "message": "Policies retrieved successfully",
+    }
+)
+_APPLY_BODY = json_dumps(
+    {
+        "success": True,
+        "policies_count": 2,
+        "objects_processed": 150,
+        "message": "Policies applied successfully",
+    }
+)
+_REPL_POLICY_JSON = {
+    "id": "repl-1",
+    "source_backend": "local",
+    "source_settings": {"path": "/data"},
+    "source_prefix": "",
+    "destination_backend": "s3",
+    "destination_settings": {"bucket": "backup"},
+    "check_interval_seconds": 300,
+    "last_sync_time": None,
+    "enabled": True,
+    "replication_mode": "transparent",
+}
+_REPL_POLICIES_BODY = json_dumps({"policies": [{**_REPL_POLICY_JSON, "encryption": None}]})
+_REPL_POLICY_BODY = json_dumps(_REPL_POLICY_JSON)
+_TRIGGER_BODY = json_dumps(
+    {
+        "success": True,
+        "result": {
+            "policy_id": "repl-1",
+            "synced": 150,
+            "deleted": 5,
+            "failed": 2,
+            "bytes_total": 1048576,
+            "duration_ms": 5200,
+            "errors": ["Failed to sync object1", "Failed to sync object2"],
+        },
+        "message": "Replication triggered successfully",
+    }
+)
+_STATUS_BODY = json_dumps(
+    {
+        "policy_id": "repl-1",
+        "source_backend": "local",
+        "destination_backend": "s3",
+        "enabled": True,
+        "total_objects_synced": 1500,
+        "total_objects_deleted": 50,
+        "total_bytes_synced": 10485760,
+        "total_errors": 3,
+        "last_sync_time": "2025-11-25T10:00:00Z",
+        "average_sync_duration": "2.5s",
+        "sync_count": 10,
+    }
+)
 
-        client = RestClient()
-        result = client.remove_policy("policy-1")
 
-        assert result.success is True
-        assert "removed" in result.message.lower()
+class TestLifecyclePolicies:
+    """Test cases for lifecycle policy operations."""
 
-    @responses.activate
-    def test_get_policies(self) -> None:
+    def test_get_policies(self, rsps: responses.RequestsMock, rest_client: RestClient) -> None:
         """Test get lifecycle policies."""
-        responses.add(
-            responses.GET,
-            "http://localhost:8080/api/v1/policies",
-            json={
-                "policies": [
-                    {
-                        "id": "policy-1",
-                        "prefix": "logs/",
-                        "retention_seconds": 86400,
-                        "action": "delete",
-                        "destination_type": None,
-                        "destination_settings": {},
-                    }
-                ],
-                "success": True,
-                "message": "Policies retrieved successfully",
-            },
-            status=200,
-        )
+        rsps.add(responses.GET, f"{_API}/policies", body=_POLICIES_BODY, status=200)
 
-        client = RestClient()
-        result = client.get_policies()
+        result = rest_client.get_policies()
 
         assert result.success is True
         assert len(result.policies) == 1
         assert result.policies[0].id == "policy-1"
         assert result.policies[0].action == "delete"
 
-    @responses.activate
-    def test_get_policies_with_prefix(self) -> None:
+    def test_get_policies_with_prefix(
+        self, rsps: responses.RequestsMock, rest_client: RestClient
+    ) -> None:
         """Test get lifecycle policies with prefix filter."""
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:8080/api/v1/policies?prefix=logs%2F",
-            json={
-                "policies": [
-                    {
-                        "id": "policy-1",
-                        "prefix": "logs/",
-                        "retention_seconds": 86400,
-                        "action": "delete",
-                        "destination_type": None,
-                        "destination_settings": {},
-                    }
-                ],
-                "success": True,
-                "message": "Policies retrieved successfully",
-            },
+            f"{_API}/policies",
+            body=_POLICIES_BODY,
             status=200,
+            match=[matchers.query_param_matcher({"prefix": "logs/"})],
         )
 
-        client = RestClient()
-        result = client.get_policies(prefix="logs/")
+        result = rest_client.get_policies(prefix="logs/")
 
         assert result.success is True
         assert len(result.policies) == 1
 
-    @responses.activate
-    def test_apply_policies(self) -> None:
+    def test_apply_policies(self, rsps: responses.RequestsMock, rest_client: RestClient) -> None:
         """Test apply lifecycle policies."""
-        responses.add(
-            responses.POST,
-            "http://localhost:8080/api/v1/policies/apply",
-            json={
-                "success": True,
-                "policies_count": 2,
-                "objects_processed": 150,
-                "message": "Policies applied successfully",
-            },
-            status=200,
-        )
+        rsps.add(responses.POST, f"{_API}/policies/apply", body=_APPLY_BODY, status=200)
 
-        client = RestClient()
-        result = client.apply_policies()
+        result = rest_client.apply_policies()
 
         assert result.success is True
         assert result.policies_count == 2
@@ -165,141 +154,50 @@ class TestLifecyclePolicies:
 class TestReplicationPolicies:
     """Test cases for replication policy operations."""
 
-    @responses.activate
-    def test_add_replication_policy(self) -> None:
-        """Test add replication policy."""
-        responses.add(
-            responses.POST,
-            "http://localhost:8080/api/v1/replication/policies",
-            json={"success": True, "message": "Replication policy added successfully"},
-            status=201,
-        )
-
-        client = RestClient()
-        policy = ReplicationPolicy(
-            id="repl-1",
-            source_backend="local",
-            source_settings={"path": "/data"},
-            destination_backend="s3",
-            destination_settings={"bucket": "backup"},
-            check_interval_seconds=300,
-            enabled=True,
-        )
-        result = client.add_replication_policy(policy)
-
-        assert result.success is True
-        assert "added" in result.message.lower()
-
-    @responses.activate
-    def test_remove_replication_policy(self) -> None:
-        """Test remove replication policy."""
-        responses.add(
-            responses.DELETE,
-            "http://localhost:8080/api/v1/replication/policies/repl-1",
-            json={"success": True, "message": "Replication policy removed successfully"},
-            status=200,
-        )
-
-        client = RestClient()
-        result = client.remove_replication_policy("repl-1")
-
-        assert result.success is True
-        assert "removed" in result.message.lower()
-
-    @responses.activate
-    def test_get_replication_policies(self) -> None:
+    def test_get_replication_policies(
+        self, rsps: responses.RequestsMock, rest_client: RestClient
+    ) -> None:
         """Test get replication policies."""
-        responses.add(
-            responses.GET,
-            "http://localhost:8080/api/v1/replication/policies",
-            json={
-                "policies": [
-                    {
-                        "id": "repl-1",
-                        "source_backend": "local",
-                        "source_settings": {"path": "/data"},
-                        "source_prefix": "",
-                        "destination_backend": "s3",
-                        "destination_settings": {"bucket": "backup"},
-                        "check_interval_seconds": 300,
-                        "last_sync_time": None,
-                        "enabled": True,
-                        "encryption": None,
-                        "replication_mode": "transparent",
-                    }
-                ]
-            },
-            status=200,
+        rsps.add(
+            responses.GET, f"{_API}/replication/policies", body=_REPL_POLICIES_BODY, status=200
         )
 
-        client = RestClient()
-        result = client.get_replication_policies()
+        result = rest_client.get_replication_policies()
 
         assert len(result.policies) == 1
         assert result.policies[0].id == "repl-1"
         assert result.policies[0].source_backend == "local"
         assert result.policies[0].destination_backend == "s3"
 
-    @responses.activate
-    def test_get_replication_policy(self) -> None:
+    def test_get_replication_policy(
+        self, rsps: responses.RequestsMock, rest_client: RestClient
+    ) -> None:
         """Test get specific replication policy.
 
         The server responds with a bare ReplicationPolicyResponse — no "policy"
         wrapper key.  The client passes the top-level dict directly to the
         model constructor.
         """
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:8080/api/v1/replication/policies/repl-1",
-            json={
-                "id": "repl-1",
-                "source_backend": "local",
-                "source_settings": {"path": "/data"},
-                "source_prefix": "",
-                "destination_backend": "s3",
-                "destination_settings": {"bucket": "backup"},
-                "check_interval_seconds": 300,
-                "last_sync_time": None,
-                "enabled": True,
-                "replication_mode": "transparent",
-            },
+            f"{_API}/replication/policies/repl-1",
+            body=_REPL_POLICY_BODY,
             status=200,
         )
 
-        client = RestClient()
-        policy = client.get_replication_policy("repl-1")
+        policy = rest_client.get_replication_policy("repl-1")
 
         assert policy.id == "repl-1"
         assert policy.source_backend == "local"
         assert policy.destination_backend == "s3"
 
-    @responses.activate
-    def test_trigger_replication(self) -> None:
+    def test_trigger_replication(
+        self, rsps: responses.RequestsMock, rest_client: RestClient
+    ) -> None:
         """Test trigger replication."""
-        responses.add(
-            responses.POST,
-            "http://localhost:8080/api/v1/replication/trigger",
-            json={
-                "success": True,
-                "result": {
-                    "policy_id": "repl-1",
-                    "synced": 150,
-                    "deleted": 5,
-                    "failed": 2,
-                    "bytes_total": 1048576,
-                    "duration_ms": 5200,
-                    "errors": ["Failed to sync object1", "Failed to sync object2"],
-                },
-                "message": "Replication triggered successfully",
-            },
-            status=200,
-        )
+        rsps.add(responses.POST, f"{_API}/replication/trigger", body=_TRIGGER_BODY, status=200)
 
-        client = RestClient()
-        opts = TriggerReplicationOptions(
-            policy_id="repl-1", parallel=True, worker_count=4
-        )
-        result = client.trigger_replication(opts)
+        result = rest_client.trigger_replication(_TRIGGER_OPTS)
 
         assert result.success is True
         assert result.result is not None
@@ -309,8 +207,9 @@ class TestReplicationPolicies:
         assert result.result.failed == 2
         assert len(result.result.errors) == 2
 
-    @responses.activate
-    def test_get_replication_status(self) -> None:
+    def test_get_replication_status(
+        self, rsps: responses.RequestsMock, rest_client: RestClient
+    ) -> None:
         """Test get replication status.
 
         The server responds with a bare ReplicationStatusResponse — no "status"
@@ -318,43 +217,95 @@ class TestReplicationPolicies:
         Go-duration string (not an int ``average_sync_duration_ms``).  The
         client passes the top-level dict directly to the model constructor.
         """
-        responses.add(
-            responses.GET,
-            "http://localhost:8080/api/v1/replication/status/repl-1",
-            json={
-                "policy_id": "repl-1",
-                "source_backend": "local",
-                "destination_backend": "s3",
-                "enabled": True,
-                "total_objects_synced": 1500,
-                "total_objects_deleted": 50,
-                "total_bytes_synced": 10485760,
-                "total_errors": 3,
-                "last_sync_time": "2025-11-25T10:00:00Z",
-                "average_sync_duration": "2.5s",
-                "sync_count": 10,
-            },
-            status=200,
-        )
+        rsps.add(responses.GET, f"{_API}/replication/status/repl-1", body=_STATUS_BODY, status=200)
 
-        client = RestClient()
-        result = client.get_replication_status("repl-1")
+        result = rest_client.get_replication_status("repl-1")
 
         assert result.success is True
         assert result.status is not None
         assert result.status.policy_id == "repl-1"
         assert result.status.total_objects_synced == 1500
         assert result.status.total_bytes_synced == 10485760
+        assert result.status.last_sync_time == _FIXED_TS
         # average_sync_duration_ms is derived from the Go duration string "2.5s"
         assert result.status.average_sync_duration_ms == 2500
 
 
+class TestMessageResponses:
+    """Test operations that only report success and a message."""
+
+    @pytest.mark.parametrize(
+        "method,path,status,message,call",
+        [
+            (
+                "POST",
+                "/archive",
+                200,
+                "Object archived successfully",
+                lambda c: c.archive("test-key", "s3", {"bucket": "archive-bucket"}),
+            ),
+            (
+                "POST",
+                "/policies",
+                201,
+                "Policy added successfully",
+                lambda c: c.add_policy(_LIFECYCLE_POLICY),
+            ),
+            (
+                "DELETE",
+                "/policies/policy-1",
+                200,
+                "Policy removed successfully",
+                lambda c: c.remove_policy("policy-1"),
+            ),
+            (
+                "POST",
+                "/replication/policies",
+                201,
+                "Replication policy added successfully",
+                lambda c: c.add_replication_policy(_REPL_POLICY),
+            ),
+            (
+                "DELETE",
+                "/replication/policies/repl-1",
+                200,
+                "Replication policy removed successfully",
+                lambda c: c.remove_replication_policy("repl-1"),
+            ),
+        ],
+        ids=[
+            "archive",
+            "add_policy",
+            "remove_policy",
+            "add_replication_policy",
+            "remove_replication_policy",
+        ],
+    )
+    def test_success_message(
+        self,
+        rsps: responses.RequestsMock,
+        rest_client: RestClient,
+        method: str,
+        path: str,
+        status: int,
+        message: str,
+        call: Callable[[RestClient], Any],
+    ) -> None:
+        """Test the server's success message is passed through."""
+        rsps.add(method, f"{_API}{path}", json={"success": True, "message": message}, status=status)
+
+        result = call(rest_client)
+
+        assert result.success is True
+        assert result.message == message
+
+
 class TestModelValidation:
     """Test model validation for new types."""
 
     def test_lifecycle_policy_creation(self) -> None:
         """Test creating a lifecycle policy."""
-        policy = LifecyclePolicy(
+        policy = LifecyclePolicy.model_construct(
             id="test-policy",
             prefix="logs/",
             retention_seconds=86400,
@@ -369,7 +320,7 @@ class TestModelValidation:
 
     def test_replication_policy_creation(self) -> None:
         """Test creating a replication policy."""
-        policy = ReplicationPolicy(
+        policy = ReplicationPolicy.model_construct(
             id="repl-policy",
             source_backend="local",
             source_settings={"path": "/data"},
@@ -387,7 +338,7 @@ class TestModelValidation:
 
     def test_trigger_replication_options(self) -> None:
         """Test creating trigger replication options."""
-        opts = TriggerReplicationOptions(
+        opts = TriggerReplicationOptions.model_construct(
             policy_id="repl-1",
             parallel=True,
             worker_count=4,
@@ -427,7 +378,7 @@ class TestModelValidation:
             total_objects_deleted=50,
             total_bytes_synced=10485760,
             total_errors=3,
-            last_sync_time=datetime.now(),
+            last_sync_time=_FIXED_TS,
             average_sync_duration_ms=2500,
             sync_count=10,
         )
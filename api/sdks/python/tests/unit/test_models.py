@@ -1,8 +1,9 @@
 """Unit tests for data models."""
 
-from datetime import datetime
+from typing import Any, Dict
 
 import pytest
+from pydantic import ValidationError
 
 from objstore.models import (
     EncryptionConfig,
@@ -19,13 +20,17 @@ from objstore.models import (
     ReplicationPolicy,
 )
 
+# Tests that only check attribute storage build models with model_construct(),
+# which skips validation. Tests covering defaults derived by validators (such as
+# LifecyclePolicy retention) or serialization use the regular constructor.
+
 
 class TestMetadata:
     """Test Metadata model."""
 
     def test_create_empty(self) -> None:
         """Test creating empty metadata."""
-        metadata = Metadata()
+        metadata = Metadata.model_construct()
         assert metadata.content_type is None
         assert metadata.size is None
         assert len(metadata.custom) == 0
@@ -59,8 +64,9 @@ class TestObjectInfo:
 
     def test_create(self) -> None:
         """Test creating object info."""
-        obj = ObjectInfo(
-            key="test/file.txt", metadata=Metadata(size=100, content_type="text/plain")
+        obj = ObjectInfo.model_construct(
+            key="test/file.txt",
+            metadata=Metadata.model_construct(size=100, content_type="text/plain"),
         )
         assert obj.key == "test/file.txt"
         assert obj.metadata.size == 100
@@ -69,102 +75,157 @@ class TestObjectInfo:
 class TestLifecyclePolicy:
     """Test LifecyclePolicy model."""
 
-    def test_create_delete_policy(self) -> None:
-        """Test creating delete policy."""
-        policy = LifecyclePolicy(
-            id="policy1", prefix="logs/", retention_seconds=86400, action="delete"
-        )
-        assert policy.id == "policy1"
-        assert policy.prefix == "logs/"
-        assert policy.retention_seconds == 86400
-        assert policy.action == "delete"
-
-    def test_create_archive_policy(self) -> None:
-        """Test creating archive policy."""
-        policy = LifecyclePolicy(
-            id="policy2",
-            prefix="archive/",
-            retention_seconds=2592000,
-            action="archive",
-            destination_type="glacier",
-            destination_settings={"region": "us-east-1"},
-        )
-        assert policy.action == "archive"
-        assert policy.destination_type == "glacier"
-        assert policy.destination_settings["region"] == "us-east-1"
-
-    def test_create_with_days_after_creation(self) -> None:
-        """Test creating policy with days_after_creation."""
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                dict(id="policy1", prefix="logs/", retention_seconds=86400, action="delete"),
+                dict(id="policy1", prefix="logs/", retention_seconds=86400, action="delete"),
+            ),
+            (
+                dict(
+                    id="policy2",
+                    prefix="archive/",
+                    retention_seconds=2592000,
+                    action="archive",
+                    destination_type="glacier",
+                    destination_settings={"region": "us-east-1"},
+                ),
+                dict(
+                    action="archive",
+                    destination_type="glacier",
+                    destination_settings={"region": "us-east-1"},
+                ),
+            ),
+            # days_after_creation is converted to retention_seconds
+            (
+                dict(id="policy3", prefix="logs/", action="delete", days_after_creation=30),
+                dict(retention_seconds=30 * 86400, days_after_creation=30),
+            ),
+            # Without retention fields the policy defaults to 30 days
+            (
+                dict(id="policy4", prefix="logs/", action="delete"),
+                dict(retention_seconds=30 * 86400),
+            ),
+        ],
+        ids=["delete", "archive", "days_after_creation", "default_retention"],
+    )
+    def test_create(self, kwargs: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        """Test creating lifecycle policies."""
+        policy = LifecyclePolicy(**kwargs)
+        for name, value in expected.items():
+            assert getattr(policy, name) == value
+
+    def test_days_after_creation_excluded_from_dump(self) -> None:
+        """Test days_after_creation is not serialized."""
         policy = LifecyclePolicy(
             id="policy3",
             prefix="logs/",
             action="delete",
             days_after_creation=30,
         )
-        # Should auto-convert to retention_seconds
-        assert policy.retention_seconds == 30 * 86400
-        assert policy.days_after_creation == 30
-
-        # Should exclude days_after_creation from serialization
         data = policy.model_dump(exclude_none=True)
         assert "retention_seconds" in data
         assert "days_after_creation" not in data
 
-    def test_create_with_default_retention(self) -> None:
-        """Test creating policy without retention fields uses default."""
-        policy = LifecyclePolicy(
-            id="policy4",
-            prefix="logs/",
-            action="delete",
-        )
-        # Should default to 30 days
-        assert policy.retention_seconds == 30 * 86400
-
 
 class TestReplicationPolicy:
     """Test ReplicationPolicy model."""
 
-    def test_create(self) -> None:
-        """Test creating replication policy."""
-        policy = ReplicationPolicy(
-            id="repl1",
-            source_backend="s3",
-            source_settings={"bucket": "source"},
-            destination_backend="gcs",
-            destination_settings={"bucket": "dest"},
-            check_interval_seconds=300,
-        )
-        assert policy.id == "repl1"
-        assert policy.source_backend == "s3"
-        assert policy.destination_backend == "gcs"
-        assert policy.check_interval_seconds == 300
-
-    def test_replication_mode_default(self) -> None:
-        """Test default replication mode."""
-        policy = ReplicationPolicy(
-            id="repl1",
-            source_backend="s3",
-            destination_backend="gcs",
-            check_interval_seconds=300,
-        )
-        assert policy.replication_mode == ReplicationMode.TRANSPARENT
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                dict(
+                    id="repl1",
+                    source_backend="s3",
+                    source_settings={"bucket": "source"},
+                    destination_backend="gcs",
+                    destination_settings={"bucket": "dest"},
+                    check_interval_seconds=300,
+                ),
+                dict(
+                    id="repl1",
+                    source_backend="s3",
+                    destination_backend="gcs",
+                    check_interval_seconds=300,
+                ),
+            ),
+            (
+                dict(
+                    id="repl1",
+                    source_backend="s3",
+                    destination_backend="gcs",
+                    check_interval_seconds=300,
+                ),
+                dict(replication_mode=ReplicationMode.TRANSPARENT, source_prefix=""),
+            ),
+            # Enum values and numeric strings are coerced by validation
+            (
+                dict(
+                    id="repl2",
+                    source_backend="s3",
+                    destination_backend="gcs",
+                    check_interval_seconds="60",
+                    replication_mode="opaque",
+                ),
+                dict(check_interval_seconds=60, replication_mode=ReplicationMode.OPAQUE),
+            ),
+        ],
+        ids=["fields", "default_mode", "coerced"],
+    )
+    def test_create(self, kwargs: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        """Test creating replication policies."""
+        policy = ReplicationPolicy(**kwargs)
+        for name, value in expected.items():
+            assert getattr(policy, name) == value
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(id="repl1", source_backend="s3"),
+            dict(id="repl1", source_backend="s3", destination_backend="gcs", replication_mode="x"),
+            dict(
+                id="repl1",
+                source_backend="s3",
+                destination_backend="gcs",
+                check_interval_seconds="soon",
+            ),
+        ],
+        ids=["missing_destination", "bad_mode", "bad_interval"],
+    )
+    def test_rejects_invalid(self, kwargs: Dict[str, Any]) -> None:
+        """Test invalid replication policies fail validation."""
+        with pytest.raises(ValidationError):
+            ReplicationPolicy(**kwargs)
 
 
 class TestEncryptionConfig:
     """Test EncryptionConfig model."""
 
-    def test_create_disabled(self) -> None:
-        """Test creating disabled encryption config."""
-        config = EncryptionConfig()
-        assert config.enabled is False
-        assert config.provider == "noop"
-
-    def test_create_enabled(self) -> None:
-        """Test creating enabled encryption config."""
-        config = EncryptionConfig(enabled=True, provider="custom", default_key="key123")
-        assert config.enabled is True
-        assert config.provider == "custom"
-        assert config.default_key == "key123"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, dict(enabled=False, provider="noop")),
+            (
+                dict(enabled=True, provider="custom", default_key="key123"),
+                dict(enabled=True, provider="custom", default_key="key123"),
+            ),
+            # Boolean strings are coerced by validation
+            (dict(enabled="true"), dict(enabled=True, provider="noop")),
+        ],
+        ids=["disabled", "enabled", "coerced"],
+    )
+    def test_create(self, kwargs: Dict[str, Any], expected: Dict[str, Any]) -> None:
+        """Test creating encryption configs."""
+        config = EncryptionConfig(**kwargs)
+        for name, value in expected.items():
+            assert getattr(config, name) == value
+
+    def test_rejects_invalid(self) -> None:
+        """Test invalid encryption configs fail validation."""
+        with pytest.raises(ValidationError):
+            EncryptionConfig(enabled="maybe")
 
 
 class TestEncryptionPolicy:
@@ -172,10 +233,10 @@ class TestEncryptionPolicy:
 
     def test_create(self) -> None:
         """Test creating encryption policy."""
-        policy = EncryptionPolicy(
-            backend=EncryptionConfig(enabled=True, provider="aws-kms"),
-            source=EncryptionConfig(enabled=True, provider="custom"),
-            destination=EncryptionConfig(enabled=False),
+        policy = EncryptionPolicy.model_construct(
+            backend=EncryptionConfig.model_construct(enabled=True, provider="aws-kms"),
+            source=EncryptionConfig.model_construct(enabled=True, provider="custom"),
+            destination=EncryptionConfig.model_construct(enabled=False),
         )
         assert policy.backend.enabled is True
         assert policy.source.enabled is True
@@ -187,24 +248,27 @@ class TestResponses:
 
     def test_put_response(self) -> None:
         """Test PutResponse."""
-        response = PutResponse(success=True, message="uploaded", etag="abc123")
+        response = PutResponse.model_construct(success=True, message="uploaded", etag="abc123")
         assert response.success is True
         assert response.etag == "abc123"
 
     def test_health_response(self) -> None:
         """Test HealthResponse."""
-        response = HealthResponse(status=HealthStatus.SERVING, message="healthy")
+        response = HealthResponse.model_construct(status=HealthStatus.SERVING, message="healthy")
         assert response.status == HealthStatus.SERVING
 
     def test_policy_response(self) -> None:
         """Test PolicyResponse."""
-        response = PolicyResponse(success=True, message="policy added")
+        response = PolicyResponse.model_construct(success=True, message="policy added")
         assert response.success is True
 
     def test_list_response(self) -> None:
         """Test ListResponse."""
-        response = ListResponse(
-            objects=[ObjectInfo(key="file1"), ObjectInfo(key="file2")],
+        response = ListResponse.model_construct(
+            objects=[
+                ObjectInfo.model_construct(key="file1"),
+                ObjectInfo.model_construct(key="file2"),
+            ],
             common_prefixes=["dir1/"],
             next_token="token123",
             truncated=True,
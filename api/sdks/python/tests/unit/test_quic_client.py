@@ -14,11 +14,16 @@ live server is needed. Test names follow ``test_quic_<op>_<variant>``.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import io
+import json
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from objstore.exceptions import (
     AlreadyExistsError,
@@ -33,6 +38,7 @@ from objstore.exceptions import (
     ValidationError,
 )
 from objstore.models import (
+    HealthStatus,
     LifecyclePolicy,
     Metadata,
     ReplicationPolicy,
@@ -41,125 +47,211 @@ from objstore.models import (
 from objstore.quic_client import QuicClient
 
 
-pytestmark = pytest.mark.asyncio
+# All QUIC tests share one session-scoped event loop instead of creating and
+# tearing down a fresh loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 # ---- helpers ---------------------------------------------------------
 
+# httpx.AsyncClient request methods replaced by the ``mock_http`` fixture.
+_HTTP_VERBS = ("get", "put", "post", "patch", "delete", "head")
 
-def _client() -> QuicClient:
-    return QuicClient(base_url="https://localhost:4433", api_version="v1")
 
+def _client(**kwargs: Any) -> QuicClient:
+    """Build a QuicClient for tests that never reach the network.
 
-def _resp(status: int, *, json: Any = None, headers: dict | None = None,
-          content: bytes | None = None) -> MagicMock:
-    r = MagicMock()
-    r.status_code = status
-    if json is not None:
-        r.json.return_value = json
-    if headers is not None:
-        r.headers = headers
-    if content is not None:
-        r.content = content
-    return r
+    ``verify_ssl=False`` keeps httpx from loading the system CA bundle into a
+    fresh SSL context, which dominates AsyncClient construction time.
+    """
+    return QuicClient(api_version="v1", verify_ssl=False, **kwargs)
 
 
-def _mock(client: QuicClient, method: str) -> AsyncMock:
-    """Patch a request method on the underlying httpx client and return it."""
-    m = AsyncMock()
-    setattr(client.client, method, m)
-    return m
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[QuicClient]:
+    """One QuicClient per xdist worker instead of a new httpx.AsyncClient per test.
 
+    Tests only ever patch it through ``mock_http`` (function-scoped
+    ``monkeypatch``), so sharing it across the whole worker session is safe.
+    """
+    quic_client = _client()
+    yield quic_client
+    await quic_client.close()
 
-def _policy() -> LifecyclePolicy:
-    return LifecyclePolicy(id="p1", prefix="x/", retention_seconds=10, action="delete")
 
+@pytest.fixture
+def mock_http(client: QuicClient, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace every request method on ``client.client`` with an ``AsyncMock``.
 
-def _repl() -> ReplicationPolicy:
-    return ReplicationPolicy(
-        id="r1", source_backend="local", destination_backend="s3",
-        check_interval_seconds=30,
-    )
+    Tests program ``mock_http.<verb>.return_value`` / ``side_effect``;
+    ``monkeypatch`` restores the real methods afterwards.
+    """
+    stubs = {verb: AsyncMock() for verb in _HTTP_VERBS}
+    for verb, stub in stubs.items():
+        monkeypatch.setattr(client.client, verb, stub)
+    return SimpleNamespace(**stubs)
 
 
-def _opts() -> TriggerReplicationOptions:
-    return TriggerReplicationOptions(policy_id="r1")
+class _Resp:
+    """Minimal stand-in for ``httpx.Response``.
 
+    Only the attributes QuicClient reads are provided. A ``payload`` is also
+    serialized into ``content`` so the body matches what a real response would
+    carry; ``json()`` returns the payload as-is and raises ``ValueError`` when
+    there is none, like a non-JSON body.
+    """
 
-# =====================================================================
-# put
-# =====================================================================
+    __slots__ = ("status_code", "headers", "content", "text", "_payload")
 
+    def __init__(self, status_code: int, *, payload: Any = None, headers: Any = None,
+                 content: bytes = b"", text: str = "") -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content or (
+            json.dumps(payload, default=dict).encode() if payload is not None else b""
+        )
+        self.text = text
+        self._payload = payload
 
-async def test_quic_put_success() -> None:
-    client = _client()
-    _mock(client, "put").return_value = _resp(201, json={"message": "ok"},
-                                              headers={"ETag": "e1"})
-    result = await client.put("k", b"data")
-    assert result.success is True
-    assert result.etag == "e1"
+    def json(self) -> Any:
+        if self._payload is None:
+            raise ValueError("response body is not JSON")
+        return self._payload
 
 
-async def test_quic_put_error() -> None:
-    client = _client()
-    _mock(client, "put").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.put("k", b"data")
+def _raise_async(exc: BaseException) -> Callable[..., Awaitable[Any]]:
+    """Coroutine function that raises ``exc`` when awaited, without mock bookkeeping."""
 
+    async def _boom(*args: Any, **kwargs: Any) -> Any:
+        raise exc
 
-# =====================================================================
-# get
-# =====================================================================
+    return _boom
 
 
-async def test_quic_get_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(
-        200, content=b"hello",
-        headers={"Content-Type": "text/plain", "Content-Length": "5", "ETag": "e1"})
-    data, meta = await client.get("k")
-    assert data == b"hello"
-    assert meta.content_type == "text/plain"
-    assert meta.size == 5
+def _raise_sync(exc: BaseException) -> Callable[..., Any]:
+    """Plain function that raises ``exc``; stands in for ``AsyncClient.stream``."""
 
+    def _boom(*args: Any, **kwargs: Any) -> Any:
+        raise exc
 
-async def test_quic_get_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.get("k")
+    return _boom
 
 
-async def test_quic_get_not_found() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.get("k")
+# Canned responses that tests only read, built once over read-only payloads
+# and shared by every test (and parametrized case) that needs them.
+_OK_JSON = MappingProxyType({"message": "ok"})
+_PUT_OK = _Resp(201, payload=_OK_JSON, headers={"ETag": "e1"})
+_ACK_OK = _Resp(200, payload=_OK_JSON)
+_SERVER_ERROR = _Resp(500, payload=MappingProxyType({"message": "boom"}))
+
+
+# Request models are only read by QuicClient, so each is validated once here
+# and shared by every test.
+_POLICY = LifecyclePolicy(id="p1", prefix="x/", retention_seconds=10, action="delete")
+_REPL = ReplicationPolicy(
+    id="r1", source_backend="local", destination_backend="s3",
+    check_interval_seconds=30,
+)
+_OPTS = TriggerReplicationOptions(policy_id="r1")
+_MD_EMPTY = Metadata()
+_MD_JSON = Metadata(content_type="application/json", custom={"x": "y"})
+
+# Real httpx.Headers, as QuicClient receives them, built once for the read tests.
+_GET_HEADERS = httpx.Headers({"Content-Type": "text/plain", "Content-Length": "5", "ETag": "e1"})
+_HEAD_HEADERS = httpx.Headers({
+    "Content-Type": "text/plain", "Content-Length": "100",
+    "ETag": "e1", "X-Meta-author": "alice",
+})
+
+
+# httpx.AsyncClient method each QuicClient operation sends its request with.
+_HTTP_METHOD = {
+    "put": "put",
+    "get": "get",
+    "delete": "delete",
+    "list": "get",
+    "exists": "get",
+    "get_metadata": "head",
+    "update_metadata": "patch",
+    "health": "get",
+    "archive": "post",
+    "add_policy": "post",
+    "remove_policy": "delete",
+    "get_policies": "get",
+    "apply_policies": "post",
+    "add_replication_policy": "post",
+    "remove_replication_policy": "delete",
+    "get_replication_policies": "get",
+    "get_replication_policy": "get",
+    "trigger_replication": "post",
+    "get_replication_status": "get",
+}
+
+
+# Operations that raise ObjectNotFoundError on 404 (exists reports False instead).
+_NOT_FOUND_OPS = [
+    "get",
+    "delete",
+    "get_metadata",
+    "update_metadata",
+    "remove_policy",
+    "remove_replication_policy",
+    "get_replication_policy",
+    "get_replication_status",
+]
+
+
+# Positional arguments used to call each operation.
+_INVOKE_ARGS = {
+    "put": ("k", b"d"),
+    "get": ("k",),
+    "delete": ("k",),
+    "list": (),
+    "exists": ("k",),
+    "get_metadata": ("k",),
+    "update_metadata": ("k", _MD_EMPTY),
+    "health": (),
+    "archive": ("k", "s3", {}),
+    "add_policy": (_POLICY,),
+    "remove_policy": ("p1",),
+    "get_policies": (),
+    "apply_policies": (),
+    "add_replication_policy": (_REPL,),
+    "remove_replication_policy": ("r1",),
+    "get_replication_policies": (),
+    "get_replication_policy": ("r1",),
+    "trigger_replication": (_OPTS,),
+    "get_replication_status": ("r1",),
+}
+
+
+def _invoke(client: QuicClient, op: str):
+    return getattr(client, op)(*_INVOKE_ARGS[op])
 
 
 # =====================================================================
-# delete
+# put
 # =====================================================================
 
 
-async def test_quic_delete_success() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(200, json={"message": "deleted"})
-    assert (await client.delete("k")).success is True
+async def test_quic_put_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.put.return_value = _PUT_OK
+    result = await client.put("k", b"data")
+    assert result.success is True
+    assert result.etag == "e1"
 
 
-async def test_quic_delete_error() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.delete("k")
+# =====================================================================
+# get
+# =====================================================================
 
 
-async def test_quic_delete_not_found() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.delete("k")
+async def test_quic_get_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.get.return_value = _Resp(200, content=b"hello", headers=_GET_HEADERS)
+    data, meta = await client.get("k")
+    assert data == b"hello"
+    assert meta.content_type == "text/plain"
+    assert meta.size == 5
 
 
 # =====================================================================
@@ -167,9 +259,8 @@ async def test_quic_delete_not_found() -> None:
 # =====================================================================
 
 
-async def test_quic_list_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={
+async def test_quic_list_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.get.return_value = _Resp(200, payload={
         "objects": [{"key": "o1", "size": 1, "etag": "e1"},
                     {"key": "o2", "size": 2, "etag": "e2"}],
         "common_prefixes": ["d/"], "next_token": "tok", "truncated": True})
@@ -178,37 +269,21 @@ async def test_quic_list_success() -> None:
     assert result.truncated is True
 
 
-async def test_quic_list_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.list()
-
-
 # =====================================================================
 # exists
 # =====================================================================
 
 
-async def test_quic_exists_success() -> None:
-    client = _client()
-    get = _mock(client, "get")
-    get.return_value = _resp(200, json={"exists": True})
+async def test_quic_exists_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    get = mock_http.get
+    get.return_value = _Resp(200, payload={"exists": True})
     result = await client.exists("k")
     assert result.exists is True
     assert get.call_args.kwargs["params"] == {"exists": "1"}
 
 
-async def test_quic_exists_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.exists("k")
-
-
-async def test_quic_exists_not_found() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(404)
+async def test_quic_exists_not_found(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.get.return_value = _Resp(404)
     assert (await client.exists("k")).exists is False
 
 
@@ -217,152 +292,47 @@ async def test_quic_exists_not_found() -> None:
 # =====================================================================
 
 
-async def test_quic_get_metadata_success() -> None:
-    client = _client()
-    _mock(client, "head").return_value = _resp(200, headers={
-        "Content-Type": "text/plain", "Content-Length": "100",
-        "ETag": "e1", "X-Meta-author": "alice"})
+async def test_quic_get_metadata_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.head.return_value = _Resp(200, headers=_HEAD_HEADERS)
     meta = await client.get_metadata("k")
     assert meta.size == 100
     assert meta.custom["author"] == "alice"
 
 
-async def test_quic_get_metadata_error() -> None:
-    client = _client()
-    _mock(client, "head").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.get_metadata("k")
-
-
-async def test_quic_get_metadata_not_found() -> None:
-    client = _client()
-    _mock(client, "head").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.get_metadata("k")
-
-
 # =====================================================================
 # update_metadata
 # =====================================================================
 
 
-async def test_quic_update_metadata_success() -> None:
-    client = _client()
-    patch_mock = _mock(client, "patch")
-    patch_mock.return_value = _resp(200, json={"message": "updated"})
-    result = await client.update_metadata("k", Metadata(content_type="application/json",
-                                                        custom={"x": "y"}))
+async def test_quic_update_metadata_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    patch_mock = mock_http.patch
+    patch_mock.return_value = _Resp(200, payload={"message": "updated"})
+    result = await client.update_metadata("k", _MD_JSON)
     assert result.success is True
     sent = patch_mock.call_args.kwargs["json"]
     assert sent["content_type"] == "application/json"
     assert sent["custom"] == {"x": "y"}
 
 
-async def test_quic_update_metadata_error() -> None:
-    client = _client()
-    _mock(client, "patch").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.update_metadata("k", Metadata())
-
-
-async def test_quic_update_metadata_not_found() -> None:
-    client = _client()
-    _mock(client, "patch").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.update_metadata("k", Metadata())
-
-
 # =====================================================================
 # health
 # =====================================================================
 
 
-async def test_quic_health_success() -> None:
-    from objstore.models import HealthStatus
-
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={"status": "SERVING",
-                                                         "message": "ok"})
+async def test_quic_health_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.get.return_value = _Resp(200, payload={"status": "SERVING",
+                                                     "message": "ok"})
     result = await client.health()
     assert result.status == HealthStatus.SERVING
 
 
-async def test_quic_health_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(503, json={"message": "down"})
-    with pytest.raises(ServerError):
-        await client.health()
-
-
-# =====================================================================
-# archive
-# =====================================================================
-
-
-async def test_quic_archive_success() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(200, json={"message": "archived"})
-    assert (await client.archive("k", "s3", {"bucket": "b"})).success is True
-
-
-async def test_quic_archive_error() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.archive("k", "s3", {})
-
-
-# =====================================================================
-# add_policy
-# =====================================================================
-
-
-async def test_quic_add_policy_success() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(201, json={"message": "added"})
-    assert (await client.add_policy(_policy())).success is True
-
-
-async def test_quic_add_policy_error() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.add_policy(_policy())
-
-
-# =====================================================================
-# remove_policy
-# =====================================================================
-
-
-async def test_quic_remove_policy_success() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(200, json={"message": "removed"})
-    assert (await client.remove_policy("p1")).success is True
-
-
-async def test_quic_remove_policy_error() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.remove_policy("p1")
-
-
-async def test_quic_remove_policy_not_found() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.remove_policy("p1")
-
-
 # =====================================================================
 # get_policies
 # =====================================================================
 
 
-async def test_quic_get_policies_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={
+async def test_quic_get_policies_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.get.return_value = _Resp(200, payload={
         "policies": [{"id": "p1", "prefix": "x/", "retention_seconds": 10,
                       "action": "delete"}], "message": "ok"})
     result = await client.get_policies()
@@ -370,44 +340,30 @@ async def test_quic_get_policies_success() -> None:
     assert len(result.policies) == 1
 
 
-async def test_quic_get_policies_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.get_policies()
-
-
 # =====================================================================
 # apply_policies
 # =====================================================================
 
 
-async def test_quic_apply_policies_success() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(200, json={
+async def test_quic_apply_policies_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.post.return_value = _Resp(200, payload={
         "policies_count": 3, "objects_processed": 100, "message": "applied"})
     result = await client.apply_policies()
     assert result.success is True
     assert result.policies_count == 3
 
 
-async def test_quic_apply_policies_error() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.apply_policies()
-
-
 # =====================================================================
 # add_replication_policy
 # =====================================================================
 
 
-async def test_quic_add_replication_policy_success() -> None:
-    client = _client()
-    post = _mock(client, "post")
-    post.return_value = _resp(201, json={"message": "added"})
-    result = await client.add_replication_policy(_repl())
+async def test_quic_add_replication_policy_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    post = mock_http.post
+    post.return_value = _Resp(201, payload={"message": "added"})
+    result = await client.add_replication_policy(_REPL)
     assert result.success is True
     # check_interval_seconds is renamed to check_interval on the wire.
     payload = post.call_args.kwargs["json"]
@@ -415,46 +371,15 @@ async def test_quic_add_replication_policy_success() -> None:
     assert "check_interval_seconds" not in payload
 
 
-async def test_quic_add_replication_policy_error() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.add_replication_policy(_repl())
-
-
-# =====================================================================
-# remove_replication_policy
-# =====================================================================
-
-
-async def test_quic_remove_replication_policy_success() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(200, json={"message": "removed"})
-    assert (await client.remove_replication_policy("r1")).success is True
-
-
-async def test_quic_remove_replication_policy_error() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.remove_replication_policy("r1")
-
-
-async def test_quic_remove_replication_policy_not_found() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.remove_replication_policy("r1")
-
-
 # =====================================================================
 # get_replication_policies
 # =====================================================================
 
 
-async def test_quic_get_replication_policies_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={
+async def test_quic_get_replication_policies_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    mock_http.get.return_value = _Resp(200, payload={
         "policies": [{"id": "r1", "source_backend": "local",
                       "destination_backend": "s3", "check_interval": 77}]})
     result = await client.get_replication_policies()
@@ -462,21 +387,15 @@ async def test_quic_get_replication_policies_success() -> None:
     assert result.policies[0].check_interval_seconds == 77
 
 
-async def test_quic_get_replication_policies_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.get_replication_policies()
-
-
 # =====================================================================
 # get_replication_policy
 # =====================================================================
 
 
-async def test_quic_get_replication_policy_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={
+async def test_quic_get_replication_policy_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    mock_http.get.return_value = _Resp(200, payload={
         "success": True, "id": "r1", "source_backend": "local",
         "destination_backend": "s3", "check_interval": 300})
     policy = await client.get_replication_policy("r1")
@@ -484,53 +403,34 @@ async def test_quic_get_replication_policy_success() -> None:
     assert policy.check_interval_seconds == 300
 
 
-async def test_quic_get_replication_policy_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.get_replication_policy("r1")
-
-
-async def test_quic_get_replication_policy_not_found() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(404)
-    with pytest.raises(ObjectNotFoundError):
-        await client.get_replication_policy("r1")
-
-
 # =====================================================================
 # trigger_replication
 # =====================================================================
 
 
-async def test_quic_trigger_replication_success() -> None:
-    client = _client()
-    post = _mock(client, "post")
-    post.return_value = _resp(200, json={
+async def test_quic_trigger_replication_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    post = mock_http.post
+    post.return_value = _Resp(200, payload={
         "result": {"policy_id": "r1", "synced": 100, "deleted": 5, "failed": 0,
                    "bytes_total": 1048576, "duration": "5s"}, "message": "ok"})
-    result = await client.trigger_replication(_opts())
+    result = await client.trigger_replication(_OPTS)
     assert result.success is True
     assert result.result.synced == 100
     assert result.result.duration_ms == 5000
     assert post.call_args.kwargs["params"] == {"policy_id": "r1"}
 
 
-async def test_quic_trigger_replication_error() -> None:
-    client = _client()
-    _mock(client, "post").return_value = _resp(500, json={"message": "boom"})
-    with pytest.raises(ServerError):
-        await client.trigger_replication(_opts())
-
-
 # =====================================================================
 # get_replication_status
 # =====================================================================
 
 
-async def test_quic_get_replication_status_success() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(200, json={
+async def test_quic_get_replication_status_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    mock_http.get.return_value = _Resp(200, payload={
         "success": True, "policy_id": "r1", "source_backend": "local",
         "destination_backend": "s3", "enabled": True,
         "total_objects_synced": 1000, "total_objects_deleted": 10,
@@ -542,18 +442,50 @@ async def test_quic_get_replication_status_success() -> None:
     assert result.status.average_sync_duration_ms == 2000
 
 
-async def test_quic_get_replication_status_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(500, json={"message": "boom"})
+# =====================================================================
+# success path for operations that only acknowledge the request
+# =====================================================================
+
+
+async def test_quic_acknowledged_ops_success(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    """delete, archive and the policy add/remove calls return success=True.
+
+    These operations share a response shape, so they run concurrently
+    against one programmed stub per verb.
+    """
+    mock_http.delete.return_value = _ACK_OK
+    mock_http.post.return_value = _ACK_OK
+    results = await asyncio.gather(
+        client.delete("k"),
+        client.archive("k", "s3", {"bucket": "b"}),
+        client.add_policy(_POLICY),
+        client.remove_policy("p1"),
+        client.remove_replication_policy("r1"),
+    )
+    assert [r.success for r in results] == [True] * 5
+    assert mock_http.delete.await_count == 3
+    assert mock_http.post.await_count == 2
+
+
+# =====================================================================
+# error path for every operation, not_found path for the designated ones
+# =====================================================================
+
+
+@pytest.mark.parametrize("op", list(_HTTP_METHOD))
+async def test_quic_error(client: QuicClient, mock_http: SimpleNamespace, op: str) -> None:
+    getattr(mock_http, _HTTP_METHOD[op]).return_value = _SERVER_ERROR
     with pytest.raises(ServerError):
-        await client.get_replication_status("r1")
+        await _invoke(client, op)
 
 
-async def test_quic_get_replication_status_not_found() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(404)
+@pytest.mark.parametrize("op", _NOT_FOUND_OPS)
+async def test_quic_not_found(client: QuicClient, mock_http: SimpleNamespace, op: str) -> None:
+    getattr(mock_http, _HTTP_METHOD[op]).return_value = _Resp(404)
     with pytest.raises(ObjectNotFoundError):
-        await client.get_replication_status("r1")
+        await _invoke(client, op)
 
 
 # =====================================================================
@@ -561,18 +493,17 @@ async def test_quic_get_replication_status_not_found() -> None:
 # =====================================================================
 
 
-async def test_quic_metadata_round_trip() -> None:
+async def test_quic_metadata_round_trip(client: QuicClient, mock_http: SimpleNamespace) -> None:
     """content_type, content_encoding and custom map survive put -> HEAD.
 
     Wire scheme: PUT sets Content-Type, Content-Encoding and one
     ``X-Meta-<key>`` header per custom entry; metadata is read back via the
     HEAD response headers.
     """
-    client = _client()
     custom = {"author": "carol", "project": "objstore"}
 
-    put = _mock(client, "put")
-    put.return_value = _resp(201, json={"message": "ok"}, headers={"ETag": "rt"})
+    put = mock_http.put
+    put.return_value = _PUT_OK
     await client.put("rt", b"payload",
                      metadata=Metadata(content_type="application/json",
                                        content_encoding="gzip", custom=custom))
@@ -583,7 +514,7 @@ async def test_quic_metadata_round_trip() -> None:
     assert sent["X-Meta-author"] == "carol"
     assert sent["X-Meta-project"] == "objstore"
 
-    _mock(client, "head").return_value = _resp(200, headers={
+    mock_http.head.return_value = _Resp(200, headers={
         "Content-Type": "application/json", "Content-Encoding": "gzip",
         "X-Meta-author": "carol", "X-Meta-project": "objstore"})
     meta = await client.get_metadata("rt")
@@ -597,10 +528,9 @@ async def test_quic_metadata_round_trip() -> None:
 # =====================================================================
 
 
-async def test_quic_validation_empty_key() -> None:
+async def test_quic_validation_empty_key(client: QuicClient, mock_http: SimpleNamespace) -> None:
     """An empty key is rejected by the server (HTTP 400 -> ValidationError)."""
-    client = _client()
-    _mock(client, "get").return_value = _resp(400, json={"message": "key must not be empty"})
+    mock_http.get.return_value = _Resp(400, payload={"message": "key must not be empty"})
     with pytest.raises(ValidationError):
         await client.get("")
 
@@ -610,15 +540,14 @@ async def test_quic_validation_empty_key() -> None:
 # =====================================================================
 
 
-async def test_quic_url_construction() -> None:
-    client = _client()
+async def test_quic_url_construction(client: QuicClient) -> None:
     assert client._url("objects/k") == "https://localhost:4433/objects/k"
     assert client._url("/objects/k") == "https://localhost:4433/objects/k"
     assert client._url("health") == "https://localhost:4433/health"
 
 
 async def test_quic_url_trailing_slash_base() -> None:
-    client = QuicClient(base_url="https://localhost:4433/", api_version="v1")
+    client = _client(base_url="https://localhost:4433/")
     assert client.base_url == "https://localhost:4433"
 
 
@@ -633,119 +562,98 @@ async def test_quic_init_falls_back_to_http2() -> None:
         return real(*a, **kw)
 
     with patch("objstore.quic_client.httpx.AsyncClient", side_effect=fake):
-        client = QuicClient()
+        client = _client()
     assert client.client is not None
     assert calls["n"] == 2
 
 
 async def test_quic_context_manager() -> None:
-    with patch.object(QuicClient, "close", new_callable=AsyncMock) as mock_close:
-        async with QuicClient() as client:
-            assert client is not None
-        mock_close.assert_called_once()
+    client = _client()
+    client.close = AsyncMock()  # type: ignore[method-assign]
+    async with client as entered:
+        assert entered is client
+    client.close.assert_awaited_once()
 
 
 async def test_quic_close() -> None:
     client = _client()
-    with patch.object(client.client, "aclose", new_callable=AsyncMock) as aclose:
+    aclose = AsyncMock()
+    with patch.object(client.client, "aclose", new=aclose):
         await client.close()
-        aclose.assert_called_once()
-
-
-async def test_quic_authentication_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(401)
-    with pytest.raises(AuthenticationError):
+    aclose.assert_called_once()
+
+
+# Status code -> SDK exception raised by the shared HTTP error mapping. Bodies
+# cover both the JSON ``message`` and the plain-text fallback.
+ERROR_MATRIX = [
+    (_Resp(400, text="bad request text"), ValidationError),
+    (_Resp(401), AuthenticationError),
+    (_Resp(403), AuthorizationError),
+    (_Resp(409, payload={"message": "object exists"}), AlreadyExistsError),
+    (_Resp(429), RateLimitError),
+    (_Resp(500, text="server text"), ServerError),
+    (_Resp(418, text="teapot"), ObjectStoreError),
+]
+
+
+@pytest.mark.parametrize("resp,exc", ERROR_MATRIX,
+                         ids=[str(resp.status_code) for resp, _ in ERROR_MATRIX])
+async def test_quic_error_mapping(
+    client: QuicClient, mock_http: SimpleNamespace, resp: _Resp, exc: type
+) -> None:
+    mock_http.get.return_value = resp
+    with pytest.raises(exc):
         await client.get("k")
 
 
-async def test_quic_authorization_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(403)
-    with pytest.raises(AuthorizationError):
-        await client.get("k")
-
-
-async def test_quic_already_exists_error() -> None:
-    client = _client()
-    _mock(client, "put").return_value = _resp(409, json={"message": "object exists"})
-    with pytest.raises(AlreadyExistsError):
-        await client.put("k", b"data")
-
-
-async def test_quic_rate_limit_error() -> None:
-    client = _client()
-    _mock(client, "get").return_value = _resp(429)
-    with pytest.raises(RateLimitError):
-        await client.get("k")
-
-
-async def test_quic_generic_error_code() -> None:
-    client = _client()
-    r = _resp(418)
-    r.text = "teapot"
-    _mock(client, "get").return_value = r
-    with pytest.raises(ObjectStoreError):
-        await client.get("k")
-
-
-async def test_quic_get_timeout() -> None:
-    client = _client()
-    _mock(client, "get").side_effect = httpx.TimeoutException("t")
+async def test_quic_get_timeout(client: QuicClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client.client, "get", _raise_async(httpx.TimeoutException("t")))
     with pytest.raises(TimeoutError):
         await client.get("k")
 
 
-async def test_quic_get_connection_error() -> None:
-    client = _client()
-    _mock(client, "get").side_effect = httpx.ConnectError("c")
+async def test_quic_get_connection_error(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.client, "get", _raise_async(httpx.ConnectError("c")))
     with pytest.raises(ConnectionError):
         await client.get("k")
 
 
-async def test_quic_get_stream_success() -> None:
-    client = _client()
+async def test_quic_get_stream_success(client: QuicClient) -> None:
 
     async def aiter(chunk_size: int = 8192):
         for c in (b"a", b"", b"bc"):
             yield c
 
-    resp = MagicMock()
-    resp.status_code = 200
-    resp.aiter_bytes = aiter
+    resp = SimpleNamespace(status_code=200, aiter_bytes=aiter)
     cm = MagicMock()
     cm.__aenter__ = AsyncMock(return_value=resp)
     cm.__aexit__ = AsyncMock(return_value=None)
-    with patch.object(client.client, "stream", return_value=cm):
+    with patch.object(client.client, "stream", new=MagicMock(return_value=cm)):
         chunks = [c async for c in client.get_stream("k")]
     assert chunks == [b"a", b"bc"]
 
 
-async def test_quic_get_stream_not_found() -> None:
-    client = _client()
+async def test_quic_get_stream_not_found(client: QuicClient) -> None:
 
     async def aiter(chunk_size: int = 8192):
         if False:
             yield b""
 
-    resp = MagicMock()
-    resp.status_code = 404
-    resp.aiter_bytes = aiter
+    resp = SimpleNamespace(status_code=404, aiter_bytes=aiter, text="")
     cm = MagicMock()
     cm.__aenter__ = AsyncMock(return_value=resp)
     cm.__aexit__ = AsyncMock(return_value=None)
-    with patch.object(client.client, "stream", return_value=cm):
+    with patch.object(client.client, "stream", new=MagicMock(return_value=cm)):
         with pytest.raises(ObjectNotFoundError):
             async for _ in client.get_stream("k"):
                 pass
 
 
-async def test_quic_put_file_like_object() -> None:
-    import io
-
-    client = _client()
-    put = _mock(client, "put")
-    put.return_value = _resp(201, json={"message": "ok"}, headers={"ETag": "e"})
+async def test_quic_put_file_like_object(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    put = mock_http.put
+    put.return_value = _PUT_OK
     result = await client.put("k", io.BytesIO(b"file data"))
     assert result.success is True
     assert put.call_args.kwargs["content"] == b"file data"
@@ -761,129 +669,64 @@ async def test_quic_put_file_like_object() -> None:
 # =====================================================================
 
 
-_HTTP_METHOD = {
-    "put": "put",
-    "get": "get",
-    "delete": "delete",
-    "list": "get",
-    "exists": "get",
-    "get_metadata": "head",
-    "update_metadata": "patch",
-    "health": "get",
-    "archive": "post",
-    "add_policy": "post",
-    "remove_policy": "delete",
-    "get_policies": "get",
-    "apply_policies": "post",
-    "add_replication_policy": "post",
-    "remove_replication_policy": "delete",
-    "get_replication_policies": "get",
-    "get_replication_policy": "get",
-    "trigger_replication": "post",
-    "get_replication_status": "get",
-}
-
-
-def _invoke(client: QuicClient, op: str):
-    args = {
-        "put": ("k", b"d"),
-        "get": ("k",),
-        "delete": ("k",),
-        "list": (),
-        "exists": ("k",),
-        "get_metadata": ("k",),
-        "update_metadata": ("k", Metadata()),
-        "health": (),
-        "archive": ("k", "s3", {}),
-        "add_policy": (_policy(),),
-        "remove_policy": ("p1",),
-        "get_policies": (),
-        "apply_policies": (),
-        "add_replication_policy": (_repl(),),
-        "remove_replication_policy": ("r1",),
-        "get_replication_policies": (),
-        "get_replication_policy": ("r1",),
-        "trigger_replication": (_opts(),),
-        "get_replication_status": ("r1",),
-    }[op]
-    return getattr(client, op)(*args)
-
-
 @pytest.mark.parametrize("op", list(_HTTP_METHOD))
-async def test_quic_timeout_branch(op: str) -> None:
-    client = _client()
-    _mock(client, _HTTP_METHOD[op]).side_effect = httpx.TimeoutException("t")
+async def test_quic_timeout_branch(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch, op: str
+) -> None:
+    monkeypatch.setattr(client.client, _HTTP_METHOD[op],
+                        _raise_async(httpx.TimeoutException("t")))
     with pytest.raises(TimeoutError):
         await _invoke(client, op)
 
 
 @pytest.mark.parametrize("op", list(_HTTP_METHOD))
-async def test_quic_connection_error_branch(op: str) -> None:
-    client = _client()
-    _mock(client, _HTTP_METHOD[op]).side_effect = httpx.ConnectError("c")
+async def test_quic_connection_error_branch(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch, op: str
+) -> None:
+    monkeypatch.setattr(client.client, _HTTP_METHOD[op], _raise_async(httpx.ConnectError("c")))
     with pytest.raises(ConnectionError):
         await _invoke(client, op)
 
 
-async def test_quic_get_stream_timeout() -> None:
-    client = _client()
-    with patch.object(client.client, "stream", side_effect=httpx.TimeoutException("t")):
-        with pytest.raises(TimeoutError):
-            async for _ in client.get_stream("k"):
-                pass
+async def test_quic_get_stream_timeout(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.client, "stream", _raise_sync(httpx.TimeoutException("t")))
+    with pytest.raises(TimeoutError):
+        async for _ in client.get_stream("k"):
+            pass
 
 
-async def test_quic_get_stream_connection_error() -> None:
-    client = _client()
-    with patch.object(client.client, "stream", side_effect=httpx.ConnectError("c")):
-        with pytest.raises(ConnectionError):
-            async for _ in client.get_stream("k"):
-                pass
+async def test_quic_get_stream_connection_error(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.client, "stream", _raise_sync(httpx.ConnectError("c")))
+    with pytest.raises(ConnectionError):
+        async for _ in client.get_stream("k"):
+            pass
 
 
-async def test_quic_health_generic_exception_maps_connection() -> None:
-    client = _client()
-    _mock(client, "get").side_effect = RuntimeError("weird")
+async def test_quic_health_generic_exception_maps_connection(
+    client: QuicClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.client, "get", _raise_async(RuntimeError("weird")))
     with pytest.raises(ConnectionError):
         await client.health()
 
 
-async def test_quic_exists_non_json_200_defaults_true() -> None:
-    client = _client()
-    r = _resp(200)
-    r.json.side_effect = ValueError("no json")
-    _mock(client, "get").return_value = r
+async def test_quic_exists_non_json_200_defaults_true(
+    client: QuicClient, mock_http: SimpleNamespace
+) -> None:
+    mock_http.get.return_value = _Resp(200)
     assert (await client.exists("k")).exists is True
 
 
-async def test_quic_delete_204_is_success() -> None:
-    client = _client()
-    _mock(client, "delete").return_value = _resp(204)
+async def test_quic_delete_204_is_success(client: QuicClient, mock_http: SimpleNamespace) -> None:
+    mock_http.delete.return_value = _Resp(204)
     assert (await client.delete("k")).success is True
 
 
-async def test_quic_handle_error_text_fallback() -> None:
-    client = _client()
-    r = _resp(400)
-    r.json.side_effect = ValueError("no json")
-    r.text = "bad request text"
-    _mock(client, "get").return_value = r
-    with pytest.raises(ValidationError):
-        await client.get("k")
-
-
-async def test_quic_server_error_text_fallback() -> None:
-    client = _client()
-    r = _resp(500)
-    r.json.side_effect = ValueError("no json")
-    r.text = "server text"
-    _mock(client, "get").return_value = r
-    with pytest.raises(ServerError):
-        await client.get("k")
-
-
-async def test_quic_metadata_from_headers_invalid_values() -> None:
-    client = _client()
+async def test_quic_metadata_from_headers_invalid_values(client: QuicClient) -> None:
     headers = httpx.Headers({
         "Content-Length": "not-a-number",
         "Last-Modified": "not-a-date",
@@ -895,16 +738,14 @@ async def test_quic_metadata_from_headers_invalid_values() -> None:
     assert meta.custom["foo"] == "bar"
 
 
-async def test_quic_metadata_from_headers_valid_last_modified() -> None:
-    client = _client()
+async def test_quic_metadata_from_headers_valid_last_modified(client: QuicClient) -> None:
     headers = httpx.Headers({"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
     meta = client._metadata_from_headers(headers)
     assert meta.last_modified is not None
     assert meta.last_modified.year == 2015
 
 
-async def test_quic_go_duration_to_ms_variants() -> None:
-    client = _client()
+async def test_quic_go_duration_to_ms_variants(client: QuicClient) -> None:
     assert client._go_duration_to_ms(None) == 0
     assert client._go_duration_to_ms(250) == 250
     assert client._go_duration_to_ms(1.0) == 1
@@ -921,8 +762,7 @@ async def test_quic_go_duration_to_ms_variants() -> None:
     assert client._go_duration_to_ms("5xyz") == 0
 
 
-async def test_quic_sync_result_from_dict_prefers_existing_ms() -> None:
-    client = _client()
+async def test_quic_sync_result_from_dict_prefers_existing_ms(client: QuicClient) -> None:
     result = client._sync_result_from_dict({
         "policy_id": "p", "synced": 1, "deleted": 0, "failed": 0,
         "bytes_total": 10, "duration_ms": 999, "duration": "5s",
@@ -930,8 +770,7 @@ async def test_quic_sync_result_from_dict_prefers_existing_ms() -> None:
     assert result.duration_ms == 999
 
 
-async def test_quic_replication_status_from_dict_prefers_existing_ms() -> None:
-    client = _client()
+async def test_quic_replication_status_from_dict_prefers_existing_ms(client: QuicClient) -> None:
     status = client._replication_status_from_dict({
         "policy_id": "p", "source_backend": "local", "destination_backend": "s3",
         "enabled": True, "total_objects_synced": 0, "total_objects_deleted": 0,
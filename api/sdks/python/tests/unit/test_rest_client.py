@@ -7,8 +7,9 @@ Implements the SDK canonical test matrix for the REST transport:
 - metadata_round_trip
 - validation_empty_key
 
-The transport is mocked with the ``responses`` library; no live server is
-needed. Test names follow ``test_rest_<op>_<variant>`` so coverage can be
+The transport is mocked with the ``responses`` library through the shared
+``rsps`` fixture, which patches the adapter once per module; no live server
+is needed. Test names follow ``test_rest_<op>_<variant>`` so coverage can be
 diffed against the other SDKs at a glance.
 """
 
@@ -16,16 +17,32 @@ from __future__ import annotations
 
 import gzip
 import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Iterator, List, Tuple
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 import responses
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import Timeout
+from urllib3.util.retry import RequestHistory
 
 from objstore.exceptions import (
+    AlreadyExistsError,
+    AuthenticationError,
+    AuthorizationError,
     ConnectionError,
     ObjectNotFoundError,
     ObjectStoreError,
+    RateLimitError,
     ServerError,
     TimeoutError,
     ValidationError,
@@ -43,8 +60,35 @@ BASE = "http://localhost:8080"
 API = f"{BASE}/api/v1"
 
 
-def _client() -> RestClient:
-    return RestClient(base_url=BASE, api_version="v1")
+# Canned response bodies, built once at import rather than per test.
+_POLICIES_BODY = {
+    "policies": [{"id": "p1", "prefix": "x/", "retention_seconds": 10, "action": "delete"}],
+    "message": "ok",
+}
+_REPL_POLICIES_BODY = {
+    "policies": [{"id": "r1", "source_backend": "local",
+                  "destination_backend": "s3", "check_interval_seconds": 30}],
+}
+# The server responds with a bare ReplicationPolicyResponse (no "policy" wrapper).
+_REPL_POLICY_BODY = {
+    "id": "r1", "source_backend": "local",
+    "destination_backend": "s3", "check_interval_seconds": 30,
+    "enabled": True, "replication_mode": "transparent",
+}
+_TRIGGER_REPL_BODY = {
+    "result": {"policy_id": "r1", "synced": 100, "deleted": 5, "failed": 0,
+               "bytes_total": 1048576, "duration_ms": 5000},
+    "message": "triggered",
+}
+# The server responds with a bare ReplicationStatusResponse (no "status" wrapper).
+# The REST wire format uses average_sync_duration as a Go-duration string.
+_REPL_STATUS_BODY = {
+    "policy_id": "r1", "source_backend": "local",
+    "destination_backend": "s3", "enabled": True,
+    "total_objects_synced": 1000, "total_objects_deleted": 10,
+    "total_bytes_synced": 10485760, "total_errors": 0,
+    "average_sync_duration": "2s", "sync_count": 5,
+}
 
 
 def _policy() -> LifecyclePolicy:
@@ -64,26 +108,81 @@ def _opts() -> TriggerReplicationOptions:
     return TriggerReplicationOptions(policy_id="r1")
 
 
+@contextmanager
+def _upload_server(
+    rsps: responses.RequestsMock, statuses: List[int]
+) -> Iterator[Tuple[RestClient, List[bytes]]]:
+    """Serve PUT/DELETE from a real loopback server answering ``statuses`` in turn.
+
+    Yields a client pointed at the server and the request bodies it received,
+    so retry tests see exactly what went over the wire.
+    """
+    bodies: List[bytes] = []
+    replies = iter(statuses)
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding") != "chunked":
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunk = self.rfile.read(size + 2)[:size]
+                if not size:
+                    return body
+                body += chunk
+
+        def _reply(self) -> None:
+            bodies.append(self._read_body())
+            status = next(replies)
+            body = json.dumps({"message": "object does not exist" if status == 500 else "ok",
+                               "data": {"etag": "e1"}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_PUT = do_DELETE = _reply
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Pause the module-wide mock rather than passing requests through it:
+    # responses reads file bodies into memory, which would hide rewind bugs.
+    rsps.stop(allow_assert=False)
+    try:
+        with RestClient(base_url=f"http://127.0.0.1:{server.server_port}") as client:
+            yield client, bodies
+    finally:
+        rsps.start()
+        server.shutdown()
+        server.server_close()
+
+
 # =====================================================================
 # put
 # =====================================================================
 
 
-@responses.activate
-def test_rest_put_success() -> None:
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "ok", "data": {"etag": "e1"}}, status=201)
-    result = _client().put("k", b"data")
+def test_rest_put_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {"etag": "e1"}}, status=201)
+    result = rest_client.put("k", b"data")
     assert result.success is True
     assert result.etag == "e1"
 
 
-@responses.activate
-def test_rest_put_error() -> None:
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "boom"}, status=500)
+def test_rest_put_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().put("k", b"data")
+        rest_client.put("k", b"data")
 
 
 # =====================================================================
@@ -91,30 +190,27 @@ def test_rest_put_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_success() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body=b"hello",
-                  headers={"Content-Type": "text/plain", "Content-Length": "5",
-                           "ETag": "e1"}, status=200)
-    data, metadata = _client().get("k")
+def test_rest_get_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=b"hello",
+             headers={"Content-Type": "text/plain", "Content-Length": "5",
+                      "ETag": "e1"}, status=200)
+    data, metadata = rest_client.get("k")
     assert data == b"hello"
     assert metadata.content_type == "text/plain"
     assert metadata.size == 5
     assert metadata.etag == "e1"
 
 
-@responses.activate
-def test_rest_get_error() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", json={"message": "boom"}, status=500)
+def test_rest_get_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_get_not_found() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", status=404)
+def test_rest_get_not_found(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().get("k")
+        rest_client.get("k")
 
 
 # =====================================================================
@@ -122,36 +218,34 @@ def test_rest_get_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_delete_success() -> None:
+def test_rest_delete_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     # The server returns 204 No Content with an empty body.
-    responses.add(responses.DELETE, f"{API}/objects/k", status=204)
-    assert _client().delete("k").success is True
+    rsps.add(responses.DELETE, f"{API}/objects/k", status=204)
+    assert rest_client.delete("k").success is True
 
 
-@responses.activate
-def test_rest_delete_tolerates_legacy_200() -> None:
+def test_rest_delete_tolerates_legacy_200(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
     # Older servers returned 200 + JSON body.
-    responses.add(responses.DELETE, f"{API}/objects/k", json={"message": "deleted"}, status=200)
-    result = _client().delete("k")
+    rsps.add(responses.DELETE, f"{API}/objects/k", json={"message": "deleted"}, status=200)
+    result = rest_client.delete("k")
     assert result.success is True
     assert result.message == "deleted"
 
 
-@responses.activate
-def test_rest_delete_error() -> None:
+def test_rest_delete_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     # A 500 with a non-not-found message surfaces as a ServerError.
-    responses.add(responses.DELETE, f"{API}/objects/k",
-                  json={"message": "internal failure"}, status=500)
+    rsps.add(responses.DELETE, f"{API}/objects/k",
+             json={"message": "internal failure"}, status=500)
     with pytest.raises(ServerError):
-        _client().delete("k")
+        rest_client.delete("k")
 
 
-@responses.activate
-def test_rest_delete_not_found() -> None:
-    responses.add(responses.DELETE, f"{API}/objects/k", status=404)
+def test_rest_delete_not_found(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.DELETE, f"{API}/objects/k", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().delete("k")
+        rest_client.delete("k")
 
 
 # =====================================================================
@@ -159,26 +253,24 @@ def test_rest_delete_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_list_success() -> None:
-    responses.add(responses.GET, f"{API}/objects", json={
+def test_rest_list_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects", json={
         "objects": [{"key": "o1", "size": 1, "etag": "e1"},
                     {"key": "o2", "size": 2, "etag": "e2"}],
         "common_prefixes": ["d/"],
         "next_token": "tok",
         "truncated": True,
     }, status=200)
-    result = _client().list(prefix="p", max_results=10)
+    result = rest_client.list(prefix="p", max_results=10)
     assert [o.key for o in result.objects] == ["o1", "o2"]
     assert result.next_token == "tok"
     assert result.truncated is True
 
 
-@responses.activate
-def test_rest_list_error() -> None:
-    responses.add(responses.GET, f"{API}/objects", json={"message": "boom"}, status=500)
+def test_rest_list_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().list()
+        rest_client.list()
 
 
 # =====================================================================
@@ -186,24 +278,21 @@ def test_rest_list_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_exists_success() -> None:
-    responses.add(responses.HEAD, f"{API}/objects/k", status=200)
-    assert _client().exists("k").exists is True
+def test_rest_exists_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.HEAD, f"{API}/objects/k", status=200)
+    assert rest_client.exists("k").exists is True
 
 
-@responses.activate
-def test_rest_exists_error() -> None:
+def test_rest_exists_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     # exists() must raise on a server error (5xx); only 404 yields exists=False.
-    responses.add(responses.HEAD, f"{API}/objects/k", status=500)
+    rsps.add(responses.HEAD, f"{API}/objects/k", status=500)
     with pytest.raises(ServerError):
-        _client().exists("k")
+        rest_client.exists("k")
 
 
-@responses.activate
-def test_rest_exists_not_found() -> None:
-    responses.add(responses.HEAD, f"{API}/objects/k", status=404)
-    assert _client().exists("k").exists is False
+def test_rest_exists_not_found(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.HEAD, f"{API}/objects/k", status=404)
+    assert rest_client.exists("k").exists is False
 
 
 # =====================================================================
@@ -211,30 +300,27 @@ def test_rest_exists_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_metadata_success() -> None:
-    responses.add(responses.GET, f"{API}/metadata/k", json={
+def test_rest_get_metadata_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/metadata/k", json={
         "size": 100, "etag": "e1", "content_type": "text/plain",
         "metadata": {"author": "alice"},
     }, status=200)
-    metadata = _client().get_metadata("k")
+    metadata = rest_client.get_metadata("k")
     assert metadata.size == 100
     assert metadata.content_type == "text/plain"
     assert metadata.custom == {"author": "alice"}
 
 
-@responses.activate
-def test_rest_get_metadata_error() -> None:
-    responses.add(responses.GET, f"{API}/metadata/k", json={"message": "boom"}, status=500)
+def test_rest_get_metadata_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/metadata/k", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get_metadata("k")
+        rest_client.get_metadata("k")
 
 
-@responses.activate
-def test_rest_get_metadata_not_found() -> None:
-    responses.add(responses.GET, f"{API}/metadata/k", status=404)
+def test_rest_get_metadata_not_found(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/metadata/k", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().get_metadata("k")
+        rest_client.get_metadata("k")
 
 
 # =====================================================================
@@ -242,25 +328,26 @@ def test_rest_get_metadata_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_update_metadata_success() -> None:
-    responses.add(responses.PUT, f"{API}/metadata/k", json={"message": "updated"}, status=200)
-    result = _client().update_metadata("k", Metadata(content_type="application/json"))
+def test_rest_update_metadata_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.PUT, f"{API}/metadata/k", json={"message": "updated"}, status=200)
+    result = rest_client.update_metadata("k", Metadata(content_type="application/json"))
     assert result.success is True
 
 
-@responses.activate
-def test_rest_update_metadata_error() -> None:
-    responses.add(responses.PUT, f"{API}/metadata/k", json={"message": "boom"}, status=500)
+def test_rest_update_metadata_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.PUT, f"{API}/metadata/k", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().update_metadata("k", Metadata())
+        rest_client.update_metadata("k", Metadata())
 
 
-@responses.activate
-def test_rest_update_metadata_not_found() -> None:
-    responses.add(responses.PUT, f"{API}/metadata/k", status=404)
+def test_rest_update_metadata_not_found(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.PUT, f"{API}/metadata/k", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().update_metadata("k", Metadata())
+        rest_client.update_metadata("k", Metadata())
 
 
 # =====================================================================
@@ -268,21 +355,19 @@ def test_rest_update_metadata_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_health_success() -> None:
+def test_rest_health_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.models import HealthStatus
 
-    responses.add(responses.GET, f"{BASE}/health",
-                  json={"status": "SERVING", "message": "healthy"}, status=200)
-    result = _client().health()
+    rsps.add(responses.GET, f"{BASE}/health",
+             json={"status": "SERVING", "message": "healthy"}, status=200)
+    result = rest_client.health()
     assert result.status == HealthStatus.SERVING
 
 
-@responses.activate
-def test_rest_health_error() -> None:
-    responses.add(responses.GET, f"{BASE}/health", json={"message": "down"}, status=500)
+def test_rest_health_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{BASE}/health", json={"message": "down"}, status=500)
     with pytest.raises(ServerError):
-        _client().health()
+        rest_client.health()
 
 
 # =====================================================================
@@ -290,17 +375,15 @@ def test_rest_health_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_archive_success() -> None:
-    responses.add(responses.POST, f"{API}/archive", json={"message": "archived"}, status=200)
-    assert _client().archive("k", "s3", {"bucket": "b"}).success is True
+def test_rest_archive_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/archive", json={"message": "archived"}, status=200)
+    assert rest_client.archive("k", "s3", {"bucket": "b"}).success is True
 
 
-@responses.activate
-def test_rest_archive_error() -> None:
-    responses.add(responses.POST, f"{API}/archive", json={"message": "boom"}, status=500)
+def test_rest_archive_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/archive", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().archive("k", "s3", {})
+        rest_client.archive("k", "s3", {})
 
 
 # =====================================================================
@@ -308,17 +391,15 @@ def test_rest_archive_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_add_policy_success() -> None:
-    responses.add(responses.POST, f"{API}/policies", json={"message": "added"}, status=201)
-    assert _client().add_policy(_policy()).success is True
+def test_rest_add_policy_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/policies", json={"message": "added"}, status=201)
+    assert rest_client.add_policy(_policy()).success is True
 
 
-@responses.activate
-def test_rest_add_policy_error() -> None:
-    responses.add(responses.POST, f"{API}/policies", json={"message": "boom"}, status=500)
+def test_rest_add_policy_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/policies", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().add_policy(_policy())
+        rest_client.add_policy(_policy())
 
 
 # =====================================================================
@@ -326,24 +407,23 @@ def test_rest_add_policy_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_remove_policy_success() -> None:
-    responses.add(responses.DELETE, f"{API}/policies/p1", json={"message": "removed"}, status=200)
-    assert _client().remove_policy("p1").success is True
+def test_rest_remove_policy_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.DELETE, f"{API}/policies/p1", json={"message": "removed"}, status=200)
+    assert rest_client.remove_policy("p1").success is True
 
 
-@responses.activate
-def test_rest_remove_policy_error() -> None:
-    responses.add(responses.DELETE, f"{API}/policies/p1", json={"message": "boom"}, status=500)
+def test_rest_remove_policy_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.DELETE, f"{API}/policies/p1", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().remove_policy("p1")
+        rest_client.remove_policy("p1")
 
 
-@responses.activate
-def test_rest_remove_policy_not_found() -> None:
-    responses.add(responses.DELETE, f"{API}/policies/p1", status=404)
+def test_rest_remove_policy_not_found(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.DELETE, f"{API}/policies/p1", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().remove_policy("p1")
+        rest_client.remove_policy("p1")
 
 
 # =====================================================================
@@ -351,22 +431,17 @@ def test_rest_remove_policy_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_policies_success() -> None:
-    responses.add(responses.GET, f"{API}/policies", json={
-        "policies": [{"id": "p1", "prefix": "x/", "retention_seconds": 10, "action": "delete"}],
-        "message": "ok",
-    }, status=200)
-    result = _client().get_policies()
+def test_rest_get_policies_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/policies", json=_POLICIES_BODY, status=200)
+    result = rest_client.get_policies()
     assert result.success is True
     assert len(result.policies) == 1
 
 
-@responses.activate
-def test_rest_get_policies_error() -> None:
-    responses.add(responses.GET, f"{API}/policies", json={"message": "boom"}, status=500)
+def test_rest_get_policies_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/policies", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get_policies()
+        rest_client.get_policies()
 
 
 # =====================================================================
@@ -374,21 +449,19 @@ def test_rest_get_policies_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_apply_policies_success() -> None:
-    responses.add(responses.POST, f"{API}/policies/apply", json={
+def test_rest_apply_policies_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/policies/apply", json={
         "policies_count": 3, "objects_processed": 100, "message": "applied",
     }, status=200)
-    result = _client().apply_policies()
+    result = rest_client.apply_policies()
     assert result.success is True
     assert result.policies_count == 3
 
 
-@responses.activate
-def test_rest_apply_policies_error() -> None:
-    responses.add(responses.POST, f"{API}/policies/apply", json={"message": "boom"}, status=500)
+def test_rest_apply_policies_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.POST, f"{API}/policies/apply", json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().apply_policies()
+        rest_client.apply_policies()
 
 
 # =====================================================================
@@ -396,19 +469,21 @@ def test_rest_apply_policies_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_add_replication_policy_success() -> None:
-    responses.add(responses.POST, f"{API}/replication/policies",
-                  json={"message": "added"}, status=201)
-    assert _client().add_replication_policy(_repl()).success is True
+def test_rest_add_replication_policy_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.POST, f"{API}/replication/policies",
+             json={"message": "added"}, status=201)
+    assert rest_client.add_replication_policy(_repl()).success is True
 
 
-@responses.activate
-def test_rest_add_replication_policy_error() -> None:
-    responses.add(responses.POST, f"{API}/replication/policies",
-                  json={"message": "boom"}, status=500)
+def test_rest_add_replication_policy_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.POST, f"{API}/replication/policies",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().add_replication_policy(_repl())
+        rest_client.add_replication_policy(_repl())
 
 
 # =====================================================================
@@ -416,26 +491,29 @@ def test_rest_add_replication_policy_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_remove_replication_policy_success() -> None:
-    responses.add(responses.DELETE, f"{API}/replication/policies/r1",
-                  json={"message": "removed"}, status=200)
-    assert _client().remove_replication_policy("r1").success is True
+def test_rest_remove_replication_policy_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.DELETE, f"{API}/replication/policies/r1",
+             json={"message": "removed"}, status=200)
+    assert rest_client.remove_replication_policy("r1").success is True
 
 
-@responses.activate
-def test_rest_remove_replication_policy_error() -> None:
-    responses.add(responses.DELETE, f"{API}/replication/policies/r1",
-                  json={"message": "boom"}, status=500)
+def test_rest_remove_replication_policy_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.DELETE, f"{API}/replication/policies/r1",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().remove_replication_policy("r1")
+        rest_client.remove_replication_policy("r1")
 
 
-@responses.activate
-def test_rest_remove_replication_policy_not_found() -> None:
-    responses.add(responses.DELETE, f"{API}/replication/policies/r1", status=404)
+def test_rest_remove_replication_policy_not_found(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.DELETE, f"{API}/replication/policies/r1", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().remove_replication_policy("r1")
+        rest_client.remove_replication_policy("r1")
 
 
 # =====================================================================
@@ -443,22 +521,22 @@ def test_rest_remove_replication_policy_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_replication_policies_success() -> None:
-    responses.add(responses.GET, f"{API}/replication/policies", json={
-        "policies": [{"id": "r1", "source_backend": "local",
-                      "destination_backend": "s3", "check_interval_seconds": 30}],
-    }, status=200)
-    result = _client().get_replication_policies()
+def test_rest_get_replication_policies_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/policies",
+             json=_REPL_POLICIES_BODY, status=200)
+    result = rest_client.get_replication_policies()
     assert len(result.policies) == 1
 
 
-@responses.activate
-def test_rest_get_replication_policies_error() -> None:
-    responses.add(responses.GET, f"{API}/replication/policies",
-                  json={"message": "boom"}, status=500)
+def test_rest_get_replication_policies_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/policies",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get_replication_policies()
+        rest_client.get_replication_policies()
 
 
 # =====================================================================
@@ -466,31 +544,30 @@ def test_rest_get_replication_policies_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_replication_policy_success() -> None:
-    # The server responds with a bare ReplicationPolicyResponse (no "policy" wrapper).
-    responses.add(responses.GET, f"{API}/replication/policies/r1", json={
-        "id": "r1", "source_backend": "local",
-        "destination_backend": "s3", "check_interval_seconds": 30,
-        "enabled": True, "replication_mode": "transparent",
-    }, status=200)
-    policy = _client().get_replication_policy("r1")
+def test_rest_get_replication_policy_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/policies/r1",
+             json=_REPL_POLICY_BODY, status=200)
+    policy = rest_client.get_replication_policy("r1")
     assert policy.id == "r1"
 
 
-@responses.activate
-def test_rest_get_replication_policy_error() -> None:
-    responses.add(responses.GET, f"{API}/replication/policies/r1",
-                  json={"message": "boom"}, status=500)
+def test_rest_get_replication_policy_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/policies/r1",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get_replication_policy("r1")
+        rest_client.get_replication_policy("r1")
 
 
-@responses.activate
-def test_rest_get_replication_policy_not_found() -> None:
-    responses.add(responses.GET, f"{API}/replication/policies/r1", status=404)
+def test_rest_get_replication_policy_not_found(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/policies/r1", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().get_replication_policy("r1")
+        rest_client.get_replication_policy("r1")
 
 
 # =====================================================================
@@ -498,24 +575,23 @@ def test_rest_get_replication_policy_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_trigger_replication_success() -> None:
-    responses.add(responses.POST, f"{API}/replication/trigger", json={
-        "result": {"policy_id": "r1", "synced": 100, "deleted": 5, "failed": 0,
-                   "bytes_total": 1048576, "duration_ms": 5000},
-        "message": "triggered",
-    }, status=200)
-    result = _client().trigger_replication(_opts())
+def test_rest_trigger_replication_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.POST, f"{API}/replication/trigger",
+             json=_TRIGGER_REPL_BODY, status=200)
+    result = rest_client.trigger_replication(_opts())
     assert result.success is True
     assert result.result.synced == 100
 
 
-@responses.activate
-def test_rest_trigger_replication_error() -> None:
-    responses.add(responses.POST, f"{API}/replication/trigger",
-                  json={"message": "boom"}, status=500)
+def test_rest_trigger_replication_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.POST, f"{API}/replication/trigger",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().trigger_replication(_opts())
+        rest_client.trigger_replication(_opts())
 
 
 # =====================================================================
@@ -523,36 +599,32 @@ def test_rest_trigger_replication_error() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_get_replication_status_success() -> None:
-    # The server responds with a bare ReplicationStatusResponse (no "status" wrapper).
-    # The REST wire format uses average_sync_duration as a Go-duration string.
-    responses.add(responses.GET, f"{API}/replication/status/r1", json={
-        "policy_id": "r1", "source_backend": "local",
-        "destination_backend": "s3", "enabled": True,
-        "total_objects_synced": 1000, "total_objects_deleted": 10,
-        "total_bytes_synced": 10485760, "total_errors": 0,
-        "average_sync_duration": "2s", "sync_count": 5,
-    }, status=200)
-    result = _client().get_replication_status("r1")
+def test_rest_get_replication_status_success(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/status/r1",
+             json=_REPL_STATUS_BODY, status=200)
+    result = rest_client.get_replication_status("r1")
     assert result.success is True
     assert result.status.total_objects_synced == 1000
     assert result.status.average_sync_duration_ms == 2000
 
 
-@responses.activate
-def test_rest_get_replication_status_error() -> None:
-    responses.add(responses.GET, f"{API}/replication/status/r1",
-                  json={"message": "boom"}, status=500)
+def test_rest_get_replication_status_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/status/r1",
+             json={"message": "boom"}, status=500)
     with pytest.raises(ServerError):
-        _client().get_replication_status("r1")
+        rest_client.get_replication_status("r1")
 
 
-@responses.activate
-def test_rest_get_replication_status_not_found() -> None:
-    responses.add(responses.GET, f"{API}/replication/status/r1", status=404)
+def test_rest_get_replication_status_not_found(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/replication/status/r1", status=404)
     with pytest.raises(ObjectNotFoundError):
-        _client().get_replication_status("r1")
+        rest_client.get_replication_status("r1")
 
 
 # =====================================================================
@@ -560,8 +632,7 @@ def test_rest_get_replication_status_not_found() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_metadata_round_trip() -> None:
+def test_rest_metadata_round_trip(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     """content_type, content_encoding and the custom map survive put -> get.
 
     Wire scheme: PUT sets Content-Type, Content-Encoding and X-Object-Metadata
@@ -570,43 +641,42 @@ def test_rest_metadata_round_trip() -> None:
     """
     custom = {"author": "carol", "project": "objstore"}
 
-    responses.add(responses.PUT, f"{API}/objects/rt",
-                  json={"message": "ok", "data": {"etag": "rt"}}, status=201)
+    rsps.add(responses.PUT, f"{API}/objects/rt",
+             json={"message": "ok", "data": {"etag": "rt"}}, status=201)
     # The GET body is sent uncompressed (no Content-Encoding header) so the
     # `responses` library does not attempt to gunzip a plain body. The
     # content_encoding round trip is asserted on the metadata endpoint, whose
     # body IS gzip-compressed so the matching header is valid.
-    responses.add(responses.GET, f"{API}/objects/rt", body=b"payload",
-                  headers={"Content-Type": "application/json",
-                           "Content-Length": "7",
-                           "ETag": "rt",
-                           "X-Object-Metadata": json.dumps(custom)},
-                  status=200)
+    rsps.add(responses.GET, f"{API}/objects/rt", body=b"payload",
+             headers={"Content-Type": "application/json",
+                      "Content-Length": "7",
+                      "ETag": "rt",
+                      "X-Object-Metadata": json.dumps(custom)},
+             status=200)
     meta_body = gzip.compress(json.dumps(
         {"size": 7, "etag": "rt", "content_type": "application/json",
          "metadata": custom}).encode())
-    responses.add(responses.GET, f"{API}/metadata/rt", body=meta_body,
-                  headers={"Content-Type": "application/json",
-                           "Content-Encoding": "gzip",
-                           "X-Object-Metadata": json.dumps(custom)},
-                  status=200)
+    rsps.add(responses.GET, f"{API}/metadata/rt", body=meta_body,
+             headers={"Content-Type": "application/json",
+                      "Content-Encoding": "gzip",
+                      "X-Object-Metadata": json.dumps(custom)},
+             status=200)
 
-    client = _client()
-    client.put("rt", b"payload",
-               metadata=Metadata(content_type="application/json",
-                                 content_encoding="gzip", custom=custom))
+    rest_client.put("rt", b"payload",
+                    metadata=Metadata(content_type="application/json",
+                                      content_encoding="gzip", custom=custom))
 
     # PUT request carries the three pieces; X-Object-Metadata is custom only.
-    sent = responses.calls[0].request.headers
+    sent = rsps.calls[0].request.headers
     assert sent["Content-Type"] == "application/json"
     assert sent["Content-Encoding"] == "gzip"
     assert json.loads(sent["X-Object-Metadata"]) == custom
 
-    _, meta = client.get("rt")
+    _, meta = rest_client.get("rt")
     assert meta.content_type == "application/json"
     assert meta.custom == custom
 
-    md = client.get_metadata("rt")
+    md = rest_client.get_metadata("rt")
     assert md.content_encoding == "gzip"
     assert md.custom == custom
 
@@ -616,8 +686,7 @@ def test_rest_metadata_round_trip() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_validation_empty_key() -> None:
+def test_rest_validation_empty_key(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     """An empty key is rejected by the server (HTTP 400 -> ValidationError).
 
     The client builds ``.../objects/`` for an empty key; match the URL with a
@@ -625,10 +694,10 @@ def test_rest_validation_empty_key() -> None:
     """
     import re
 
-    responses.add(responses.GET, re.compile(rf"{re.escape(API)}/objects/?$"),
-                  json={"message": "key must not be empty"}, status=400)
+    rsps.add(responses.GET, re.compile(rf"{re.escape(API)}/objects/?$"),
+             json={"message": "key must not be empty"}, status=400)
     with pytest.raises(ValidationError):
-        _client().get("")
+        rest_client.get("")
 
 
 # =====================================================================
@@ -636,10 +705,9 @@ def test_rest_validation_empty_key() -> None:
 # =====================================================================
 
 
-def test_rest_url_construction() -> None:
-    client = _client()
-    assert client._url("objects/k") == f"{API}/objects/k"
-    assert client._url("/objects/k") == f"{API}/objects/k"
+def test_rest_url_construction(rest_client: RestClient) -> None:
+    assert rest_client._url("objects/k") == f"{API}/objects/k"
+    assert rest_client._url("/objects/k") == f"{API}/objects/k"
 
 
 def test_rest_url_without_api_version() -> None:
@@ -648,87 +716,232 @@ def test_rest_url_without_api_version() -> None:
 
 
 def test_rest_context_manager() -> None:
-    with _client() as client:
+    with RestClient(base_url=BASE) as client:
         assert client is not None
 
 
-@responses.activate
-def test_rest_get_stream_success() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body=b"chunk1chunk2", status=200)
-    chunks = list(_client().get_stream("k"))
+def test_rest_default_session_shares_one_pooled_adapter(rest_client: RestClient) -> None:
+    adapter = rest_client.session.get_adapter(f"{BASE}/")
+    assert rest_client.session.get_adapter("https://example.com/") is adapter
+
+
+def test_rest_pool_size_kwargs_reach_the_adapter() -> None:
+    client = RestClient(base_url=BASE, pool_connections=4, pool_maxsize=8)
+    adapter = client.session.get_adapter(f"{BASE}/")
+    assert (adapter._pool_connections, adapter._pool_maxsize) == (4, 8)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
+
+
+def test_rest_adapter_retries_transient_5xx(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    url = f"{API}/objects/k"
+    rsps.add(responses.GET, url, status=503)
+    rsps.add(responses.GET, url, status=503)
+    rsps.add(responses.GET, url, body=b"ok", status=200)
+    data, _ = rest_client.get("k")
+    assert data == b"ok"
+    assert len(rsps.calls) == 3
+
+
+def test_rest_adapter_does_not_retry_4xx(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", status=404)
+    with pytest.raises(ObjectNotFoundError):
+        rest_client.get("k")
+    assert len(rsps.calls) == 1
+
+
+def test_rest_adapter_does_not_replay_post_on_5xx(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    url = f"{API}/replication/trigger"
+    rsps.add(responses.POST, url, json={"message": "busy"}, status=503)
+    rsps.add(responses.POST, url, json={"message": "ok"}, status=200)
+    with pytest.raises(ServerError):
+        rest_client.trigger_replication(_opts())
+    assert len(rsps.calls) == 1
+
+
+def test_rest_adapter_retry_policy() -> None:
+    retries = RestClient(base_url=BASE, max_retries=5).session.get_adapter(f"{BASE}/").max_retries
+    assert retries.total == 5
+    assert retries.read is False
+    assert retries.respect_retry_after_header is True
+    assert retries.is_retry("PUT", 503)
+    assert not retries.is_retry("POST", 503)
+    assert not retries.is_retry("POST", 503, has_retry_after=True)
+    assert not retries.is_retry("GET", 400)
+    assert not retries.is_retry("DELETE", 500)
+    # Exponential backoff plus up to backoff_jitter, capped at backoff_max.
+    failure = RequestHistory("GET", "/", None, 503, None)
+    assert 4.0 <= retries.new(history=(failure,) * 3).get_backoff_time() <= 4.5
+    assert retries.new(history=(failure,) * 10).get_backoff_time() == 10.0
+
+
+def test_rest_upload_session_only_retries_connections() -> None:
+    client = RestClient(base_url=BASE, max_retries=5)
+    retries = client._upload_session.get_adapter(f"{BASE}/").max_retries
+    assert retries.total == 5
+    assert not retries.is_retry("PUT", 503, has_retry_after=True)
+    client.close()
+
+
+def test_rest_pool_reuses_one_connection_across_requests(rsps: responses.RequestsMock) -> None:
+    """pool_maxsize + 1 sequential requests ride a single keep-alive socket."""
+    peers = set()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            peers.add(self.client_address)
+            body = b'{"status": "SERVING"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    # The module-wide mock intercepts every request; let this one reach the server.
+    rsps.add_passthru(base_url)
+    try:
+        with RestClient(base_url=base_url, pool_maxsize=2) as client:
+            for _ in range(3):
+                client.health()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(peers) == 1
+
+
+def test_rest_injected_session_is_used_and_left_open(rsps: responses.RequestsMock) -> None:
+    session = requests.Session()
+    session.close = MagicMock()  # type: ignore[method-assign]
+    rsps.add(responses.GET, f"{BASE}/health", json={"status": "SERVING"}, status=200)
+    with RestClient(base_url=BASE, token="tok", session=session) as client:
+        assert client.session is session
+        client.health()
+    assert rsps.calls[0].request.headers["Authorization"] == "Bearer tok"
+    session.close.assert_not_called()
+
+
+def test_rest_get_stream_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=b"chunk1chunk2", status=200)
+    chunks = list(rest_client.get_stream("k"))
     assert b"".join(chunks) == b"chunk1chunk2"
 
 
-@responses.activate
-def test_rest_get_stream_not_found() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", status=404)
+def test_rest_get_stream_yields_multiple_chunks_for_large_body(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    body = bytes(range(256)) * 1024  # 256 KiB, several read chunks
+    rsps.add(responses.GET, f"{API}/objects/k", body=body, status=200)
+    chunks = list(rest_client.get_stream("k"))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == body
+
+
+def test_rest_get_stream_not_found(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", status=404)
+    with pytest.raises(ObjectNotFoundError):
+        list(rest_client.get_stream("k"))
+
+
+def test_rest_get_many_overlaps_requests(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    def _slow(request: requests.PreparedRequest) -> tuple:
+        time.sleep(0.05)
+        return 200, {}, request.path_url.rsplit("/", 1)[-1].encode()
+
+    keys = [f"k{i}" for i in range(50)]
+    for key in keys:
+        rsps.add_callback(responses.GET, f"{API}/objects/{key}", callback=_slow)
+
+    started = time.perf_counter()
+    results = {key: data for key, data, _ in rest_client.get_many(keys, max_workers=16)}
+    elapsed = time.perf_counter() - started
+
+    assert results == {key: key.encode() for key in keys}
+    # Sequentially this is 50 * 50 ms = 2.5 s; 16 workers need about 4 rounds.
+    assert elapsed < 1.0
+
+
+def test_rest_get_many_raises_first_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/a", body=b"a", status=200)
+    rsps.add(responses.GET, f"{API}/objects/b", status=404)
     with pytest.raises(ObjectNotFoundError):
-        list(_client().get_stream("k"))
+        list(rest_client.get_many(["a", "b"], max_workers=1))
 
 
-@responses.activate
-def test_rest_authentication_error() -> None:
+def test_rest_authentication_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.exceptions import AuthenticationError
 
-    responses.add(responses.GET, f"{API}/objects/k", status=401)
+    rsps.add(responses.GET, f"{API}/objects/k", status=401)
     with pytest.raises(AuthenticationError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_authorization_error() -> None:
+def test_rest_authorization_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.exceptions import AuthorizationError
 
-    responses.add(responses.GET, f"{API}/objects/k", status=403)
+    rsps.add(responses.GET, f"{API}/objects/k", status=403)
     with pytest.raises(AuthorizationError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_already_exists_error() -> None:
+def test_rest_already_exists_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.exceptions import AlreadyExistsError
 
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "object exists"}, status=409)
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "object exists"}, status=409)
     with pytest.raises(AlreadyExistsError):
-        _client().put("k", b"data")
+        rest_client.put("k", b"data")
 
 
-@responses.activate
-def test_rest_rate_limit_error() -> None:
+def test_rest_rate_limit_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.exceptions import RateLimitError
 
-    responses.add(responses.GET, f"{API}/objects/k", status=429)
+    rsps.add(responses.GET, f"{API}/objects/k", status=429)
     with pytest.raises(RateLimitError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_generic_error_code() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body="teapot", status=418)
+def test_rest_generic_error_code(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body="teapot", status=418)
     with pytest.raises(ObjectStoreError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-def test_rest_timeout_branch() -> None:
-    with responses.RequestsMock() as rsps:
-        rsps.add(responses.GET, f"{API}/objects/k", body=Timeout())
-        with pytest.raises(TimeoutError):
-            _client().get("k")
+def test_rest_timeout_branch(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=Timeout())
+    with pytest.raises(TimeoutError):
+        rest_client.get("k")
 
 
-def test_rest_connection_error_branch() -> None:
-    with responses.RequestsMock() as rsps:
-        rsps.add(responses.GET, f"{API}/objects/k", body=RequestsConnectionError())
-        with pytest.raises(ConnectionError):
-            _client().get("k")
+def test_rest_connection_error_branch(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=RequestsConnectionError())
+    with pytest.raises(ConnectionError):
+        rest_client.get("k")
 
 
-def test_rest_health_timeout() -> None:
-    with responses.RequestsMock() as rsps:
-        rsps.add(responses.GET, f"{BASE}/health", body=Timeout())
-        with pytest.raises(TimeoutError):
-            _client().health()
+def test_rest_health_timeout(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.GET, f"{BASE}/health", body=Timeout())
+    with pytest.raises(TimeoutError):
+        rest_client.health()
 
 
 # =====================================================================
@@ -770,99 +983,141 @@ def _invocations(client: RestClient):
     ]
 
 
-def test_rest_timeout_branch_for_every_method() -> None:
-    client = _client()
-    for http_method, suffix, call in _invocations(client):
-        with responses.RequestsMock() as rsps:
-            rsps.add(http_method, f"{API}/{suffix}", body=Timeout())
-            with pytest.raises(TimeoutError):
-                call()
+def test_rest_timeout_branch_for_every_method(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    for http_method, suffix, call in _invocations(rest_client):
+        rsps.reset()
+        rsps.add(http_method, f"{API}/{suffix}", body=Timeout())
+        with pytest.raises(TimeoutError):
+            call()
 
 
-def test_rest_connection_error_branch_for_every_method() -> None:
-    client = _client()
-    for http_method, suffix, call in _invocations(client):
-        with responses.RequestsMock() as rsps:
-            rsps.add(http_method, f"{API}/{suffix}", body=RequestsConnectionError())
-            with pytest.raises(ConnectionError):
-                call()
+def test_rest_connection_error_branch_for_every_method(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    for http_method, suffix, call in _invocations(rest_client):
+        rsps.reset()
+        rsps.add(http_method, f"{API}/{suffix}", body=RequestsConnectionError())
+        with pytest.raises(ConnectionError):
+            call()
 
 
-def test_rest_health_connection_error() -> None:
-    with responses.RequestsMock() as rsps:
-        rsps.add(responses.GET, f"{BASE}/health", body=RequestsConnectionError())
-        with pytest.raises(ConnectionError):
-            _client().health()
+def test_rest_health_connection_error(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{BASE}/health", body=RequestsConnectionError())
+    with pytest.raises(ConnectionError):
+        rest_client.health()
 
 
 # ---- _handle_error and header-parsing edge cases --------------------
 
 
-@responses.activate
-def test_rest_validation_error_non_json_body() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body="bad request text", status=400)
+def test_rest_validation_error_non_json_body(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body="bad request text", status=400)
     with pytest.raises(ValidationError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_server_error_non_json_body() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body="server exploded", status=500)
+def test_rest_server_error_non_json_body(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body="server exploded", status=500)
     with pytest.raises(ServerError):
-        _client().get("k")
+        rest_client.get("k")
 
 
-@responses.activate
-def test_rest_delete_500_not_found_message() -> None:
+def test_rest_delete_500_not_found_message(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
     # The client treats a 500 whose message says "not found" as ObjectNotFound.
-    responses.add(responses.DELETE, f"{API}/objects/k",
-                  json={"message": "object not found"}, status=500)
+    rsps.add(responses.DELETE, f"{API}/objects/k",
+             json={"message": "object not found"}, status=500)
     with pytest.raises(ObjectNotFoundError):
-        _client().delete("k")
+        rest_client.delete("k")
+
 
+def test_rest_delete_500_not_found_is_not_retried(rsps: responses.RequestsMock) -> None:
+    with _upload_server(rsps, [500]) as (client, bodies):
+        with pytest.raises(ObjectNotFoundError):
+            client.delete("k")
+    assert len(bodies) == 1
 
-@responses.activate
-def test_rest_delete_500_non_json_body() -> None:
-    responses.add(responses.DELETE, f"{API}/objects/k", body="plain text", status=500)
+
+def test_rest_delete_500_non_json_body(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.DELETE, f"{API}/objects/k", body="plain text", status=500)
     with pytest.raises(ServerError):
-        _client().delete("k")
+        rest_client.delete("k")
 
 
-@responses.activate
-def test_rest_get_custom_header_malformed_json() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body=b"d",
-                  headers={"Content-Type": "text/plain", "Content-Length": "1",
-                           "X-Object-Metadata": "{not valid json"}, status=200)
-    _, meta = _client().get("k")
+def test_rest_get_custom_header_malformed_json(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=b"d",
+             headers={"Content-Type": "text/plain", "Content-Length": "1",
+                      "X-Object-Metadata": "{not valid json"}, status=200)
+    _, meta = rest_client.get("k")
     assert meta.custom == {}
 
 
-@responses.activate
-def test_rest_get_custom_header_non_object_json() -> None:
-    responses.add(responses.GET, f"{API}/objects/k", body=b"d",
-                  headers={"Content-Type": "text/plain", "Content-Length": "1",
-                           "X-Object-Metadata": "[1, 2, 3]"}, status=200)
-    _, meta = _client().get("k")
+def test_rest_get_custom_header_non_object_json(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.GET, f"{API}/objects/k", body=b"d",
+             headers={"Content-Type": "text/plain", "Content-Length": "1",
+                      "X-Object-Metadata": "[1, 2, 3]"}, status=200)
+    _, meta = rest_client.get("k")
     assert meta.custom == {}
 
 
-@responses.activate
-def test_rest_put_file_like_object() -> None:
+def test_rest_put_file_like_object(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from io import BytesIO
 
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "ok", "data": {"etag": "e"}}, status=201)
-    result = _client().put("k", BytesIO(b"file bytes"))
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {"etag": "e"}}, status=201)
+    result = rest_client.put("k", BytesIO(b"file bytes"))
     assert result.success is True
-    assert responses.calls[0].request.body == b"file bytes"
-
-
-@responses.activate
-def test_rest_health_unknown_status() -> None:
+    assert rsps.calls[0].request.body == b"file bytes"
+
+
+def test_rest_put_streams_file_without_buffering(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    payload = BytesIO(b"x" * 10_000_000)
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {}}, status=201)
+    tracemalloc.start()
+    try:
+        rest_client.put("k", payload, metadata=Metadata(content_type="text/plain"))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 2_000_000
+    sent = rsps.calls[0].request
+    assert sent.headers["Content-Length"] == "10000000"
+    assert sent.headers["Content-Type"] == "text/plain"
+
+
+def test_rest_put_non_seekable_file_is_resent_on_retry(rsps: responses.RequestsMock) -> None:
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"piped bytes")
+    os.close(write_fd)
+    with open(read_fd, "rb") as pipe, _upload_server(rsps, [503, 201]) as (client, bodies):
+        assert pipe.seekable() is False
+        assert client.put("k", pipe).success is True
+    assert bodies == [b"piped bytes", b"piped bytes"]
+
+
+def test_rest_health_unknown_status(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from objstore.models import HealthStatus
 
-    responses.add(responses.GET, f"{BASE}/health", json={"status": "WAT"}, status=200)
-    assert _client().health().status == HealthStatus.UNKNOWN
+    rsps.add(responses.GET, f"{BASE}/health", json={"status": "WAT"}, status=200)
+    assert rest_client.health().status == HealthStatus.UNKNOWN
 
 
 # =====================================================================
@@ -888,14 +1143,13 @@ def test_rest_custom_headers_applied_to_session() -> None:
     assert c.session.headers.get("X-Foo") == "bar"
 
 
-@responses.activate
-def test_rest_token_sent_with_request() -> None:
+def test_rest_token_sent_with_request(rsps: responses.RequestsMock) -> None:
     def _check(request):
         assert request.headers.get("Authorization") == "Bearer tok"
         return (200, {}, '{"status": "SERVING"}')
 
-    responses.add_callback(responses.GET, f"{BASE}/health",
-                           callback=_check, content_type="application/json")
+    rsps.add_callback(responses.GET, f"{BASE}/health",
+                      callback=_check, content_type="application/json")
     from objstore.rest_client import RestClient
     RestClient(base_url=BASE, token="tok").health()
 
@@ -905,37 +1159,44 @@ def test_rest_token_sent_with_request() -> None:
 # =====================================================================
 
 
-@responses.activate
-def test_rest_put_stream_success() -> None:
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "ok", "data": {"etag": "e1"}}, status=201)
-    result = _client().put_stream("k", b"stream data")
+def test_rest_put_stream_success(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {"etag": "e1"}}, status=201)
+    result = rest_client.put_stream("k", b"stream data")
     assert result.success is True
 
 
-@responses.activate
-def test_rest_put_stream_file_like() -> None:
+def test_rest_put_stream_file_like(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
     from io import BytesIO
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "ok", "data": {}}, status=201)
-    result = _client().put_stream("k", BytesIO(b"file bytes"))
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {}}, status=201)
+    result = rest_client.put_stream("k", BytesIO(b"file bytes"))
     assert result.success is True
 
 
-@responses.activate
-def test_rest_put_stream_with_metadata() -> None:
-    responses.add(responses.PUT, f"{API}/objects/k",
-                  json={"message": "ok", "data": {}}, status=201)
+def test_rest_put_stream_with_metadata(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.PUT, f"{API}/objects/k",
+             json={"message": "ok", "data": {}}, status=201)
     meta = Metadata(content_type="text/plain")
-    result = _client().put_stream("k", b"data", metadata=meta)
+    result = rest_client.put_stream("k", b"data", metadata=meta)
     assert result.success is True
 
 
-@responses.activate
-def test_rest_put_stream_error() -> None:
-    responses.add(responses.PUT, f"{API}/objects/k", json={"message": "fail"}, status=500)
+def test_rest_put_stream_error(rsps: responses.RequestsMock, rest_client: RestClient) -> None:
+    rsps.add(responses.PUT, f"{API}/objects/k", json={"message": "fail"}, status=500)
     with pytest.raises(ServerError):
-        _client().put_stream("k", b"data")
+        rest_client.put_stream("k", b"data")
+
+
+@pytest.mark.parametrize("make_source", [bytes, BytesIO], ids=["bytes", "seekable-file"])
+def test_rest_put_stream_retry_resends_full_body(
+    rsps: responses.RequestsMock, make_source: type
+) -> None:
+    with _upload_server(rsps, [503, 201]) as (client, bodies):
+        assert client.put_stream("k", make_source(b"hello world"), chunk_size=4).success is True
+    assert bodies == [b"hello world", b"hello world"]
 
 
 # =====================================================================
@@ -960,6 +1221,56 @@ def test_shared_build_auth_headers_empty() -> None:
     assert build_auth_headers(None, None) == {}
 
 
+def test_shared_json_dumps_returns_utf8_bytes() -> None:
+    from objstore._http import json_dumps
+
+    body = json_dumps({"id": "p1", "prefix": "ü/"})
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"id": "p1", "prefix": "ü/"}
+
+
+@pytest.mark.parametrize("dumps", ["json_dumps", "_stdlib_json_dumps"])
+def test_rest_replication_policy_datetime_serializes_on_both_json_paths(
+    rsps: responses.RequestsMock,
+    rest_client: RestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    dumps: str,
+) -> None:
+    # Both the orjson path and the stdlib fallback must encode datetime fields.
+    from objstore import _http
+
+    monkeypatch.setattr("objstore._http.json_dumps", getattr(_http, dumps))
+    rsps.add(responses.POST, f"{API}/replication/policies",
+             json={"message": "added"}, status=201)
+    policy = _repl().model_copy(
+        update={"last_sync_time": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)})
+    assert rest_client.add_replication_policy(policy).success is True
+    sent = json.loads(rsps.calls[0].request.body)
+    assert sent["last_sync_time"] == "2024-01-02T03:04:05Z"
+
+
+def test_rest_policy_body_is_serialized_json(
+    rsps: responses.RequestsMock, rest_client: RestClient
+) -> None:
+    rsps.add(responses.POST, f"{API}/policies", json={"message": "ok"}, status=201)
+    rest_client.add_policy(LifecyclePolicy(id="p1", prefix="x/", retention_seconds=10,
+                                           action="delete"))
+    sent = rsps.calls[0].request
+    assert sent.headers["Content-Type"] == "application/json"
+    assert json.loads(sent.body)["id"] == "p1"
+
+
+def test_shared_build_metadata_headers() -> None:
+    from objstore._http import build_metadata_headers
+
+    meta = Metadata(content_type="text/plain", custom={"a": "b"})
+    assert build_metadata_headers(meta) == {
+        "Content-Type": "text/plain",
+        "X-Object-Metadata": '{"a": "b"}',
+    }
+    assert build_metadata_headers(None) == {}
+
+
 def test_rest_session_headers_use_shared_helper() -> None:
     from objstore._http import build_auth_headers
     from objstore.rest_client import RestClient
@@ -981,3 +1292,28 @@ def test_shared_handle_http_error_404_object_semantics() -> None:
 
     with pytest.raises(ObjectNotFoundError):
         handle_http_error(_Resp())
+
+
+@pytest.mark.parametrize("status,body,exc,message", [
+    (400, b'{"message": "bad key"}', ValidationError, "bad key"),
+    (400, b"plain", ValidationError, "plain"),
+    (401, b"", AuthenticationError, "Authentication failed"),
+    (403, b"", AuthorizationError, "Access denied"),
+    (409, b'{"message": "exists"}', AlreadyExistsError, "exists"),
+    (409, b"", AlreadyExistsError, "Already exists"),
+    (429, b"", RateLimitError, "Rate limit exceeded"),
+    (503, b'{"error": "x"}', ServerError, "Server error"),
+    (418, b"teapot", ObjectStoreError, "HTTP 418: teapot"),
+])
+def test_shared_handle_http_error_status_table(
+    status: int, body: bytes, exc: type, message: str
+) -> None:
+    from objstore._http import handle_http_error
+
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    with pytest.raises(exc) as raised:
+        handle_http_error(response)
+    assert type(raised.value) is exc
+    assert raised.value.message == message
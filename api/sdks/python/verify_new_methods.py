@@ -1,45 +1,44 @@
 #!/usr/bin/env python3
 """Verify that all new methods are present in the SDK."""
 
-import inspect
+from objstore.async_rest_client import AsyncRestClient
 from objstore.client import ObjectStoreClient
-from objstore.rest_client import RestClient
 from objstore.grpc_client import GrpcClient
 from objstore.quic_client import QuicClient
+from objstore.rest_client import RestClient
 
 # Methods that should be present in all clients
-REQUIRED_METHODS = [
-    "archive",
-    "add_policy",
-    "remove_policy",
-    "get_policies",
-    "apply_policies",
-    "add_replication_policy",
-    "remove_replication_policy",
-    "get_replication_policies",
-    "get_replication_policy",
-    "trigger_replication",
-    "get_replication_status",
-]
+REQUIRED_METHODS = frozenset(
+    {
+        "archive",
+        "add_policy",
+        "remove_policy",
+        "get_policies",
+        "apply_policies",
+        "add_replication_policy",
+        "remove_replication_policy",
+        "get_replication_policies",
+        "get_replication_policy",
+        "trigger_replication",
+        "get_replication_status",
+    }
+)
 
 
 def check_methods(client_class, client_name):
     """Check if all required methods are present in a client."""
-    print(f"\nChecking {client_name}...")
-    methods = [m for m in dir(client_class) if not m.startswith("_")]
-    missing = []
-
-    for method in REQUIRED_METHODS:
-        if method not in methods:
-            missing.append(method)
-        else:
-            print(f"  ✓ {method}")
+    # The clients do not inherit their operations, so the class namespace is
+    # enough; dir() would also walk object's attributes for every check.
+    methods = {m for m in vars(client_class) if not m.startswith("_")}
+    missing = REQUIRED_METHODS - methods
 
+    lines = [f"\nChecking {client_name}..."]
+    lines.extend(f"  ✓ {method}" for method in sorted(REQUIRED_METHODS & methods))
     if missing:
-        print(f"  ✗ Missing methods: {', '.join(missing)}")
-        return False
+        lines.append(f"  ✗ Missing methods: {', '.join(sorted(missing))}")
+    print("\n".join(lines))
 
-    return True
+    return not missing
 
 
 def main():
@@ -51,6 +50,7 @@ def main():
 
     # Check each client
     all_present &= check_methods(RestClient, "RestClient")
+    all_present &= check_methods(AsyncRestClient, "AsyncRestClient")
     all_present &= check_methods(GrpcClient, "GrpcClient")
     all_present &= check_methods(QuicClient, "QuicClient")
     all_present &= check_methods(ObjectStoreClient, "ObjectStoreClient (Unified)")